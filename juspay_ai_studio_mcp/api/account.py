@@ -42,7 +42,7 @@ async def get_merchant_details_ai_studio(payload: dict = None, meta_info: dict =
     headers = {"Authorization": token}
 
     async with httpx.AsyncClient(timeout=10.0) as client:
-        logger.info(f"GET {url}")
+        logger.info("GET %s", url)
         resp = await client.get(url, headers=headers)
         resp.raise_for_status()
         return resp.json()
@@ -59,7 +59,7 @@ async def request(
 
     async with httpx.AsyncClient(timeout=30.0) as client:
         try:
-            logger.info(f"{method} {url}")
+            logger.info("%s %s", method, url)
             response = await client.request(
                 method,
                 url,
@@ -83,7 +83,7 @@ async def request(
                 f"PP Studio AI API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}"
             ) from e
         except Exception as e:
-            logger.error(f"Error during PP Studio AI API call: {e}")
+            logger.error("Error during PP Studio AI API call: %s", e)
             raise Exception(f"Failed to call PP Studio AI API: {e}") from e
 
 
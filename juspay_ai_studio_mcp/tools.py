@@ -4,7 +4,6 @@
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
-import inspect
 import json
 import logging
 from contextvars import ContextVar
@@ -13,9 +12,9 @@ import mcp.types as types
 from mcp.server.lowlevel import Server
 
 from juspay_ai_studio_mcp import response_schema
-from juspay_ai_studio_mcp.api import *
 import juspay_ai_studio_mcp.api_schema as api_schema
 import juspay_ai_studio_mcp.utils as util
+from juspay_mcp import tool_utils
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +36,10 @@ def get_juspay_request_credentials():
     return juspay_request_credentials.get()
 
 
+# Shared compact encoder for tool responses; non-JSON values raise as with json.dumps.
+_encode_response = json.JSONEncoder(separators=(",", ":")).encode
+
+
 AVAILABLE_TOOLS = [
     util.make_api_config(
         name="get_merchant_details_ai_studio",
@@ -48,7 +51,7 @@ Key features:
 
 Use this before privileged Studio AI actions to confirm which merchant/user context the caller is operating under, or when the user asks who they are logged in as.""",
         model=api_schema.account.JuspayAIStudioGetMerchantDetailsPayload,
-        handler=account.get_merchant_details_ai_studio,
+        handler="account.get_merchant_details_ai_studio",
     ),
     util.make_api_config(
         name="create_session",
@@ -65,7 +68,7 @@ Optional input:
 - model: model override for the worker.
 - approved_version: approved Studio config version to start from.""",
         model=api_schema.sessions.CreateSessionPayload,
-        handler=sessions.create_session,
+        handler="sessions.create_session",
         response_schema=response_schema.session_summary_response_schema,
     ),
     util.make_api_config(
@@ -74,7 +77,7 @@ Optional input:
 
 Use this when a session is waiting for input, completed but needs a follow-up, failed and needs retry guidance, or was stopped and should continue.""",
         model=api_schema.sessions.ResumeSessionPayload,
-        handler=sessions.resume_session,
+        handler="sessions.resume_session",
         response_schema=response_schema.session_summary_response_schema,
     ),
     util.make_api_config(
@@ -83,7 +86,7 @@ Use this when a session is waiting for input, completed but needs a follow-up, f
 
 Use this to find recent Studio AI sessions, optionally filtering by status or merchant client_id.""",
         model=api_schema.sessions.ListSessionPayload,
-        handler=sessions.list_session,
+        handler="sessions.list_session",
         response_schema=response_schema.session_list_response_schema,
     ),
     util.make_api_config(
@@ -92,7 +95,7 @@ Use this to find recent Studio AI sessions, optionally filtering by status or me
 
 Returns the current status, transcript messages, run history, worker events, state snapshot, final output, current question, and error details.""",
         model=api_schema.sessions.GetSessionPayload,
-        handler=sessions.get_session,
+        handler="sessions.get_session",
         response_schema=response_schema.session_detail_response_schema,
     ),
     util.make_api_config(
@@ -101,7 +104,7 @@ Returns the current status, transcript messages, run history, worker events, sta
 
 Use this when a session is running too long, should be paused, or needs to be put into a follow-up state before continuing.""",
         model=api_schema.sessions.StopSessionPayload,
-        handler=sessions.stop_session,
+        handler="sessions.stop_session",
         response_schema=response_schema.session_summary_response_schema,
     ),
     util.make_api_config(
@@ -110,7 +113,7 @@ Use this when a session is running too long, should be paused, or needs to be pu
 
 Use this after a session has produced or is producing payment-page config so the user can inspect the generated page. This is the get_review_url-style tool.""",
         model=api_schema.sessions.PaymentPageLinkPayload,
-        handler=sessions.payment_page_link,
+        handler="sessions.payment_page_link",
         response_schema=response_schema.payment_page_link_response_schema,
     ),
     util.make_api_config(
@@ -119,22 +122,32 @@ Use this after a session has produced or is producing payment-page config so the
 
 Use this when the user wants to download generated payment-page config files after Studio AI has created or modified them.""",
         model=api_schema.sessions.DownloadConfigsPayload,
-        handler=sessions.download_configs,
+        handler="sessions.download_configs",
         response_schema=response_schema.download_configs_response_schema,
     ),
 ]
 
+TOOLS_BY_NAME = {tool.name: tool for tool in AVAILABLE_TOOLS}
+
+
+# The AI Studio catalog is static, so Tool objects are built on the first
+# list_tools request and the same list is returned afterwards.
+_LIST_TOOLS_CACHE: list[types.Tool] | None = None
+
 
 @app.list_tools()
 async def list_my_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name=tool["name"],
-            description=tool["description"],
-            inputSchema=tool["schema"],
-        )
-        for tool in AVAILABLE_TOOLS
-    ]
+    global _LIST_TOOLS_CACHE
+    if _LIST_TOOLS_CACHE is None:
+        _LIST_TOOLS_CACHE = [
+            types.Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema=tool_utils.tool_schema(tool.model),
+            )
+            for tool in AVAILABLE_TOOLS
+        ]
+    return _LIST_TOOLS_CACHE
 
 
 @app.call_tool()
@@ -143,28 +156,26 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
     try:
         from juspay_ai_studio_mcp.api.utils import set_ai_studio_credentials
 
-        tool_entry = next((t for t in AVAILABLE_TOOLS if t["name"] == name), None)
+        tool_entry = TOOLS_BY_NAME.get(name)
         if not tool_entry:
             raise ValueError(f"Unknown tool: {name}")
 
-        schema = tool_entry["schema"]
-        required = schema.get("required", [])
-        missing = [key for key in required if key not in arguments]
+        missing = tool_utils.required_fields(tool_entry.model) - arguments.keys()
         if missing:
-            raise ValueError(f"Missing required fields for {name}: {missing}")
+            raise ValueError(f"Missing required fields for {name}: {sorted(missing)}")
 
-        handler = tool_entry["handler"]
-        if not handler:
+        if not tool_entry.handler:
             raise ValueError(f"No handler defined for tool: {name}")
+        invoke = tool_utils.resolve_handler(tool_entry.handler, "juspay_ai_studio_mcp.api")
 
         meta_info = arguments.pop("juspay_meta_info", None)
-        model_cls = tool_entry.get("model")
+        model_cls = tool_entry.model
         if model_cls:
             try:
-                payload = model_cls(**arguments)
+                payload = model_cls.model_validate(arguments)
                 payload_dict = payload.model_dump(exclude_none=True, by_alias=True)
             except Exception as e:
-                raise ValueError(f"Validation error: {str(e)}")
+                raise ValueError(f"Validation error: {tool_utils.validation_message(e)}")
         else:
             payload_dict = arguments
 
@@ -176,23 +187,10 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
             logger.info("No request credentials found, falling back to environment variables")
             set_ai_studio_credentials(None)
 
-        sig = inspect.signature(handler)
-        param_count = len(sig.parameters)
-
-        if param_count == 0:
-            response = await handler()
-        elif param_count == 1:
-            if payload_dict or not meta_info:
-                response = await handler(payload_dict)
-            else:
-                response = await handler(meta_info)
-        elif param_count == 2:
-            response = await handler(payload_dict, meta_info)
-        else:
-            raise ValueError(f"Unsupported number of parameters in tool handler: {param_count}")
+        response = await invoke(payload_dict, meta_info)
 
-        return [types.TextContent(type="text", text=json.dumps(response))]
+        return [types.TextContent(type="text", text=_encode_response(response))]
 
     except Exception as e:
-        logger.error(f"Error in AI Studio tool execution: {e}")
+        logger.error("Error in AI Studio tool execution: %s", e)
         return [types.TextContent(type="text", text=f"ERROR: Tool execution failed: {str(e)}")]
@@ -6,6 +6,16 @@
 
 import json
 import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ToolConfig:
+    name: str
+    description: str
+    model: type
+    # "<module>.<function>" under juspay_ai_studio_mcp.api, resolved on first call.
+    handler: str
 
 
 def make_api_config(name, description, model, handler, response_schema=None):
@@ -13,11 +23,4 @@ def make_api_config(name, description, model, handler, response_schema=None):
     include_response_schema = os.getenv("INCLUDE_RESPONSE_SCHEMA")
     if include_response_schema == "true" and response_schema:
         desc += f"\nReturns response following this schema:\n{json.dumps(response_schema, indent=2)}"
-    return {
-        "name": name,
-        "description": desc,
-        "model": model,
-        "schema": model.model_json_schema(),
-        "handler": handler,
-    }
-
+    return ToolConfig(name, desc, model, handler)
@@ -6,6 +6,7 @@
 
 import os
 import glob
+import importlib
 
 # Determine the package directory (the directory containing this __init__.py)
 package_dir = os.path.dirname(__file__)
@@ -19,6 +20,11 @@ for module in modules:
     module_name = os.path.basename(module)[:-3]  # Remove the .py extension
     if module_name != "__init__":
         __all__.append(module_name)
-        # Optionally import the module so that its symbols are available directly
-        __import__(f"{__name__}.{module_name}", globals(), locals(), [], 0)
 
+
+def __getattr__(name):
+    # Sub-modules are imported on first attribute access (PEP 562), so an API
+    # module only loads once one of its handlers is actually needed.
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
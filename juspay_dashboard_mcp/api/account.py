@@ -7,10 +7,9 @@
 import logging
 import os
 
-import httpx
-
 from juspay_dashboard_mcp.api.utils import (
     bind_tenant_from_auth_response,
+    get_http_client,
     get_juspay_credentials,
 )
 from juspay_dashboard_mcp.config import JUSPAY_BASE_URL
@@ -43,10 +42,10 @@ async def get_merchant_details_juspay(payload: dict = None, meta_info: dict = No
     url = f"{base_url}/ec/v2/authorize?{_AUTHORIZE_QUERY}"
     headers = {"Authorization": token}
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        logger.info(f"GET {url}")
-        resp = await client.get(url, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
-        bind_tenant_from_auth_response(data, juspay_creds)
-        return data
+    client = get_http_client()
+    logger.info(f"GET {url}")
+    resp = await client.get(url, headers=headers, timeout=10.0)
+    resp.raise_for_status()
+    data = resp.json()
+    bind_tenant_from_auth_response(data, juspay_creds)
+    return data
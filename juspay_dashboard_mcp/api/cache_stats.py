@@ -0,0 +1,15 @@
+# Copyright 2025 Juspay
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
+
+from juspay_dashboard_mcp import response_cache
+
+
+async def get_cache_stats_juspay(payload: dict = None) -> dict:
+    """
+    Returns hit/miss/stale/coalesced counters per tool for this process's
+    response cache, plus the current number of cached and in-flight entries.
+    """
+    return response_cache.stats()
@@ -17,6 +17,10 @@ import logging
 
 dotenv.load_dotenv()
 
+# Trailing "-<retry>" or "-<retry>-<silentRetry>" on a txn_id.
+_TXN_RETRY_SUFFIX_RE = re.compile(r"-\d+(?:-\d+)?$")
+_CLAUSE_INDEX_RE = re.compile(r"\d+")
+
 
 def flat_filter_to_tree(flat: FlatFilter) -> Dict[str, Any]:
     """
@@ -147,7 +151,7 @@ async def list_orders_v4_juspay(payload: dict, meta_info: dict = None) -> dict:
             def shift_indices(match):
                 return str(int(match.group(0)) + 2)
 
-            shifted_logic = re.sub(r"\d+", shift_indices, original_logic)
+            shifted_logic = _CLAUSE_INDEX_RE.sub(shift_indices, original_logic)
             enhanced_logic = f"0 AND 1 AND ({shifted_logic})"
 
             enhanced_flat_filter = FlatFilter(
@@ -223,8 +227,7 @@ def extract_order_id_from_txn_id(txn_id: str) -> str:
     - paypal-juspay-JP_1752481545-1 → JP_1752481545
     - zee5-6a45de15-6edd-4463-9415-f638a6709ee8-1 → 6a45de15-6edd-4463-9415-f638a6709ee8
     """
-    pattern = r"-\d+(?:-\d+)?$"
-    without_suffix = re.sub(pattern, "", txn_id)
+    without_suffix = _TXN_RETRY_SUFFIX_RE.sub("", txn_id)
 
    
     if without_suffix.startswith("zee5-"):
@@ -7,7 +7,6 @@
 import asyncio
 import json
 from pydantic import Field
-import httpx
 import logging
 import os
 from datetime import datetime
@@ -19,12 +18,11 @@ from juspay_dashboard_mcp.api_schema.qapi import (
     Metric,
     SortedOn,
     QApiResponse,
-    QApiSuccessResponse,
     QApiErrorResponse,
     QApiPayload,
 )
 from juspay_dashboard_mcp.config import JUSPAY_BASE_URL, get_common_headers
-from juspay_dashboard_mcp.api.utils import get_juspay_credentials
+from juspay_dashboard_mcp.api.utils import get_http_client, get_juspay_credentials
 from juspay_dashboard_mcp.api.qapi_info import validate_schema_signature
 
 logger = logging.getLogger(__name__)
@@ -51,7 +49,7 @@ def json_dumps_with_datetime(obj):
 async def call_query_api(payload: QApiPayload, meta_info: dict = None) -> dict:
     """
     Utility function to call the query API with the provided payload.
-    Uses httpx.AsyncClient for async HTTP requests.
+    Uses the shared dashboard httpx.AsyncClient for async HTTP requests.
     Resolves credentials via context var first, then meta_info, then env var fallback.
     """
     serialized_payload = {}
@@ -85,27 +83,34 @@ async def call_query_api(payload: QApiPayload, meta_info: dict = None) -> dict:
         headers["Content-Type"] = "application/json"
 
         api_url = f"{JUSPAY_BASE_URL}/api/q/query"
-        logging.info(f"QAPI Call: url={api_url} payload={serialized_payload}")
-
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                api_url,
-                content=json_dumps_with_datetime(serialized_payload),
-                headers=headers,
-            )
-        logging.info(f"QAPI Response Raw: {response.text}")
+        logging.info("QAPI Call: url=%s payload=%s", api_url, serialized_payload)
+
+        client = get_http_client()
+        response = await client.post(
+            api_url,
+            content=json_dumps_with_datetime(serialized_payload),
+            headers=headers,
+            timeout=120.0,
+        )
+        logging.info("QAPI Response Raw: %s", response.text)
         response.raise_for_status()
 
-        response_json = [json.loads(line) for line in response.text.splitlines()]
-        validated_response = QApiSuccessResponse.model_validate(response_json)
-        logging.info(f"QAPI Return: Parsed response: {validated_response}")
-        return validated_response.dict()
+        # The body is NDJSON; joining the lines into one JSON array lets a single
+        # json.loads call parse every row instead of one call per line.
+        response_json = json.loads("[" + ",".join(response.text.splitlines()) + "]")
+        # Trust boundary: rows come from Juspay's authenticated query API, and
+        # QApiSuccessRow declares no fields, so QApiSuccessResponse validation
+        # plus dump would only copy them. Check the shape and return them as-is.
+        if not all(isinstance(row, dict) for row in response_json):
+            raise ValueError("Unexpected query API response: expected one JSON object per line")
+        logging.info("QAPI Return: Parsed response: %s", response_json)
+        return response_json
     except Exception as e:
-        logging.error(f"Error calling query API: {str(e)}")
+        logging.error("Error calling query API: %s", e)
         return QApiErrorResponse(
             error=f"Failed to execute query: {str(e)}",
             payload_attempted=serialized_payload or payload.model_dump(),
-        ).dict()
+        ).model_dump()
 
 
 async def q_api(payload: dict, meta_info: dict = None) -> QApiResponse:
@@ -146,7 +151,8 @@ async def q_api(payload: dict, meta_info: dict = None) -> QApiResponse:
         }
 
     logging.info(
-        f"QAPI Tool Input: Domain={domain}, Interval={interval}, Metric={metric}, Dimensions={dimensions}, Filters={filters}, SortedOn={sortedOn}"
+        "QAPI Tool Input: Domain=%s, Interval=%s, Metric=%s, Dimensions=%s, Filters=%s, SortedOn=%s",
+        domain, interval, metric, dimensions, filters, sortedOn,
     )
     # Construct the payload using the QApiPayload model with proper types
     q_api_payload = QApiPayload(
@@ -159,6 +165,7 @@ async def q_api(payload: dict, meta_info: dict = None) -> QApiResponse:
     )
 
     # Log the payload for debugging
-    logging.debug(f"QAPI Tool: Creating payload: {json.dumps(q_api_payload.model_dump())}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("QAPI Tool: Creating payload: %s", json.dumps(q_api_payload.model_dump()))
 
     return await call_query_api(q_api_payload, meta_info)
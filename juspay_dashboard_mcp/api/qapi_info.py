@@ -11,10 +11,9 @@ import time
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 
-import httpx
 
 from juspay_dashboard_mcp.config import JUSPAY_BASE_URL, get_common_headers
-from juspay_dashboard_mcp.api.utils import get_juspay_credentials
+from juspay_dashboard_mcp.api.utils import get_http_client, get_juspay_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -167,12 +166,12 @@ async def qapi_info(payload: dict, meta_info: dict = None) -> dict:
     dimensions: list = []
     filters: list = []
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            raw = resp.json()
-            dimensions = raw.get("dimension", [])
-            filters = raw.get("filter", [])
+        client = get_http_client()
+        resp = await client.get(url, headers=headers)
+        resp.raise_for_status()
+        raw = resp.json()
+        dimensions = raw.get("dimension", [])
+        filters = raw.get("filter", [])
     except Exception as e:
         logger.error(f"qapi_info: API call failed for domain={domain}: {e}")
 
@@ -224,11 +223,11 @@ async def qapi_field_value_discovery(payload: dict, meta_info: dict = None) -> d
     info_url = f"{JUSPAY_BASE_URL}/api/q/{domain}/info"
     info_fields: set[str] = set()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(info_url, headers=headers)
-            resp.raise_for_status()
-            raw = resp.json()
-            info_fields = set(raw.get("dimension", [])) | set(raw.get("filter", []))
+        client = get_http_client()
+        resp = await client.get(info_url, headers=headers)
+        resp.raise_for_status()
+        raw = resp.json()
+        info_fields = set(raw.get("dimension", [])) | set(raw.get("filter", []))
     except Exception as e:
         logger.error(f"qapi_field_value_discovery: failed to fetch info for domain={domain}: {e}")
 
@@ -306,32 +305,32 @@ async def qapi_field_value_discovery(payload: dict, meta_info: dict = None) -> d
             }
             fv_url = f"{JUSPAY_BASE_URL}/api/q/query?api=filters"
             logger.info(f"[field_value_discovery] POST {fv_url} for dimension={dimension}")
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    fv_url,
-                    headers={**headers, "Content-Type": "application/json"},
-                    content=json.dumps(fv_payload),
-                )
-                resp.raise_for_status()
-                seen: set = set()
-                for line in resp.text.splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        raw_value = data.get(dimension)
-                        if raw_value is None:
-                            continue
-                        if isinstance(raw_value, bool):
-                            value = raw_value
-                        else:
-                            value = str(raw_value)
-                        if value not in seen and (isinstance(value, bool) or (isinstance(value, str) and value.strip())):
-                            candidates.append(value)
-                            seen.add(value)
-                    except json.JSONDecodeError:
+            client = get_http_client()
+            resp = await client.post(
+                fv_url,
+                headers={**headers, "Content-Type": "application/json"},
+                content=json.dumps(fv_payload),
+            )
+            resp.raise_for_status()
+            seen: set = set()
+            for line in resp.text.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                    raw_value = data.get(dimension)
+                    if raw_value is None:
                         continue
+                    if isinstance(raw_value, bool):
+                        value = raw_value
+                    else:
+                        value = str(raw_value)
+                    if value not in seen and (isinstance(value, bool) or (isinstance(value, str) and value.strip())):
+                        candidates.append(value)
+                        seen.add(value)
+                except json.JSONDecodeError:
+                    continue
         except Exception as e:
             logger.error(f"qapi_field_value_discovery: failed to fetch values for {dimension}: {e}")
 
@@ -8,6 +8,8 @@ import os
 import httpx
 import logging
 from contextvars import ContextVar
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from functools import lru_cache
 from urllib.parse import urlparse
 from juspay_dashboard_mcp.config import (
     get_common_headers,
@@ -30,8 +32,42 @@ def get_juspay_credentials() -> dict | None:
     return juspay_credentials.get()
 
 
+# One pooled client for every dashboard API call, so consecutive tool calls
+# reuse keep-alive connections instead of paying a TLS handshake each time.
+# Callers that need a different timeout pass it per request.
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared dashboard API client, creating it on first use.
+
+    The client serves every user and tenant, so its cookie jar accepts no
+    cookies: a Set-Cookie from one caller's response must never be sent on
+    another caller's request.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from main.py's lifespan)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=1024)
 def _normalize_host(value: str | None) -> str | None:
-    """Reduce a host or URL to a bare lowercase hostname for comparison."""
+    """Reduce a host or URL to a bare lowercase hostname for comparison.
+
+    Memoized: the same handful of portal hosts are checked on every request.
+    """
     if not value:
         return None
     value = value.strip()
@@ -72,21 +108,21 @@ async def call(api_url: str, additional_headers: dict = None, meta_info: dict =
     if additional_headers:
         headers.update(additional_headers)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.info(f"Calling Juspay API at: {api_url} with headers: {headers}")
-            response = await client.get(api_url, headers=headers)
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"API Response Data: {response_data}")
-            return response_data
-        except httpx.HTTPStatusError as e:
-            error_content = e.response.text if e.response else "Unknown error"
-            logger.error(f"HTTP error: {e.response.status_code if e.response else 'No response'} - {error_content}")
-            raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
-        except Exception as e:
-            logger.error(f"Error during Juspay API call: {e}")
-            raise Exception(f"Failed to call Juspay API: {e}") from e
+    client = get_http_client()
+    try:
+        logger.info("Calling Juspay API at: %s with headers: %s", api_url, headers)
+        response = await client.get(api_url, headers=headers)
+        response.raise_for_status()
+        response_data = response.json()
+        logger.info("API Response Data: %s", response_data)
+        return response_data
+    except httpx.HTTPStatusError as e:
+        error_content = e.response.text if e.response else "Unknown error"
+        logger.error("HTTP error: %s - %s", e.response.status_code if e.response else 'No response', error_content)
+        raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
+    except Exception as e:
+        logger.error("Error during Juspay API call: %s", e)
+        raise Exception(f"Failed to call Juspay API: {e}") from e
 
 async def post(api_url: str, payload: dict,additional_headers: dict = None, meta_info: dict= None) -> dict:
     # Get Juspay credentials from context or use meta_info for backward compatibility
@@ -99,21 +135,21 @@ async def post(api_url: str, payload: dict,additional_headers: dict = None, meta
     if additional_headers:
         headers.update(additional_headers)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.info(f"Calling Juspay API at: {api_url} with body: {payload} and headers: {headers}")
-            response = await client.post(api_url, headers=headers, json=payload)
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"API Response Data: {response_data}")
-            return response_data
-        except httpx.HTTPStatusError as e:
-            error_content = e.response.text if e.response else "Unknown error"
-            logger.error(f"HTTP error: {e.response.status_code if e.response else 'No response'} - {error_content}")
-            raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
-        except Exception as e:
-            logger.error(f"Error during Juspay API call: {e}")
-            raise Exception(f"Failed to call Juspay API: {e}") from e
+    client = get_http_client()
+    try:
+        logger.info("Calling Juspay API at: %s with body: %s and headers: %s", api_url, payload, headers)
+        response = await client.post(api_url, headers=headers, json=payload)
+        response.raise_for_status()
+        response_data = response.json()
+        logger.info("API Response Data: %s", response_data)
+        return response_data
+    except httpx.HTTPStatusError as e:
+        error_content = e.response.text if e.response else "Unknown error"
+        logger.error("HTTP error: %s - %s", e.response.status_code if e.response else 'No response', error_content)
+        raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
+    except Exception as e:
+        logger.error("Error during Juspay API call: %s", e)
+        raise Exception(f"Failed to call Juspay API: {e}") from e
 
 
 async def put(api_url: str, payload: dict, additional_headers: dict = None, meta_info: dict = None):
@@ -132,24 +168,24 @@ async def put(api_url: str, payload: dict, additional_headers: dict = None, meta
     if additional_headers:
         headers.update(additional_headers)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    client = get_http_client()
+    try:
+        logger.info("PUT %s body=%s headers=%s", api_url, payload, headers)
+        response = await client.put(api_url, headers=headers, json=payload)
+        response.raise_for_status()
         try:
-            logger.info(f"PUT {api_url} body={payload} headers={headers}")
-            response = await client.put(api_url, headers=headers, json=payload)
-            response.raise_for_status()
-            try:
-                response_data = response.json()
-            except ValueError:
-                response_data = response.text
-            logger.info(f"API Response: {response_data}")
-            return response_data
-        except httpx.HTTPStatusError as e:
-            error_content = e.response.text if e.response else "Unknown error"
-            logger.error(f"HTTP error: {e.response.status_code if e.response else 'No response'} - {error_content}")
-            raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
-        except Exception as e:
-            logger.error(f"Error during Juspay PUT call: {e}")
-            raise Exception(f"Failed to call Juspay API: {e}") from e
+            response_data = response.json()
+        except ValueError:
+            response_data = response.text
+        logger.info("API Response: %s", response_data)
+        return response_data
+    except httpx.HTTPStatusError as e:
+        error_content = e.response.text if e.response else "Unknown error"
+        logger.error("HTTP error: %s - %s", e.response.status_code if e.response else 'No response', error_content)
+        raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
+    except Exception as e:
+        logger.error("Error during Juspay PUT call: %s", e)
+        raise Exception(f"Failed to call Juspay API: {e}") from e
         
 
 async def get_juspay_host_from_api(token: str = None, headers: dict = None, meta_info: dict = None) -> str:
@@ -167,7 +203,7 @@ async def get_juspay_host_from_api(token: str = None, headers: dict = None, meta
     if not token_to_use and meta_info:
         token_to_use = meta_info.get("x-web-logintoken")
         
-    logger.info(f"Using token for validation: {token_to_use}")  
+    logger.info("Using token for validation: %s", token_to_use)
     if not token_to_use:
         raise Exception("Juspay token not provided.")
 
@@ -190,14 +226,14 @@ async def get_juspay_host_from_api(token: str = None, headers: dict = None, meta
                 "Authorization": token_to_use,
             }
 
-            logger.info(f"OAuth authorization - Request URL: GET {url}")
+            logger.info("OAuth authorization - Request URL: GET %s", url)
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(url, headers=oauth_headers)
-                resp.raise_for_status()
-                bind_tenant_from_auth_response(resp.json(), juspay_creds)
-                logger.info(f"OAuth auth_type detected, returning {base_url}")
-                return base_url
+            client = get_http_client()
+            resp = await client.get(url, headers=oauth_headers, timeout=10.0)
+            resp.raise_for_status()
+            bind_tenant_from_auth_response(resp.json(), juspay_creds)
+            logger.info("OAuth auth_type detected, returning %s", base_url)
+            return base_url
         else:
             # For non-OAuth, use regular token validation endpoint
             validate_url = f"{base_url}/api/ec/v1/validate/token"
@@ -207,24 +243,24 @@ async def get_juspay_host_from_api(token: str = None, headers: dict = None, meta
             if headers: # headers from function signature
                 request_api_headers.update(headers)
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    validate_url,
-                    headers=request_api_headers,
-                    json=json_payload
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                bind_tenant_from_auth_response(data, juspay_creds)
-                valid_host = data.get("validHost")
-                if not valid_host:
-                    raise Exception("validHost not found in Juspay token validation response.")
-                if not valid_host.startswith("http"):
-                    valid_host = f"https://{valid_host}"
-                logger.info(f"Using valid host: {valid_host}")
-                return valid_host
+            client = get_http_client()
+            resp = await client.post(
+                validate_url,
+                headers=request_api_headers,
+                json=json_payload
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            bind_tenant_from_auth_response(data, juspay_creds)
+            valid_host = data.get("validHost")
+            if not valid_host:
+                raise Exception("validHost not found in Juspay token validation response.")
+            if not valid_host.startswith("http"):
+                valid_host = f"https://{valid_host}"
+            logger.info("Using valid host: %s", valid_host)
+            return valid_host
     except Exception as e:
-        logger.error(f"Token validation failed: {e}")
+        logger.error("Token validation failed: %s", e)
         raise
 
 async def get_admin_host(token: str = None, headers: dict = None ,meta_info: dict = None) -> tuple[str, bool]:
@@ -269,18 +305,18 @@ async def get_admin_host(token: str = None, headers: dict = None ,meta_info: dic
                 "Authorization": token_to_use,
             }
 
-            logger.info(f"OAuth authorization - Request URL: GET {url}")
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(url, headers=oauth_headers)
-                resp.raise_for_status()
-                data = resp.json()
-                bind_tenant_from_auth_response(data, juspay_creds)
-                context = data.get("context")
-                # Check if context is JUSPAY
-                isadmin = context == "JUSPAY"
-                logger.info(f"OAuth auth_type detected, context: {context}, isadmin: {isadmin}, returning {base_url}")
-                return base_url, isadmin
+            logger.info("OAuth authorization - Request URL: GET %s", url)
+
+            client = get_http_client()
+            resp = await client.get(url, headers=oauth_headers, timeout=10.0)
+            resp.raise_for_status()
+            data = resp.json()
+            bind_tenant_from_auth_response(data, juspay_creds)
+            context = data.get("context")
+            # Check if context is JUSPAY
+            isadmin = context == "JUSPAY"
+            logger.info("OAuth auth_type detected, context: %s, isadmin: %s, returning %s", context, isadmin, base_url)
+            return base_url, isadmin
         else:
             # For non-OAuth, use regular token validation endpoint
             validate_url = f"{base_url}/api/ec/v1/validate/token"
@@ -289,28 +325,28 @@ async def get_admin_host(token: str = None, headers: dict = None ,meta_info: dic
             juspay_creds = get_juspay_credentials()
             request_api_headers = get_common_headers(json_payload, meta_info, juspay_creds)
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    validate_url,
-                    headers=request_api_headers,
-                    json=json_payload
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                bind_tenant_from_auth_response(data, juspay_creds)
-                context = data.get("context")
-                # Check if context is JUSPAY
-                isadmin = context == "JUSPAY"
-
-                valid_host = data.get("validHost")
-                if not valid_host:
-                    raise Exception("validHost not found in Juspay token validation response.")
-                if not valid_host.startswith("http"):
-                    valid_host = f"https://{valid_host}"
-                
-                return valid_host, isadmin
+            client = get_http_client()
+            resp = await client.post(
+                validate_url,
+                headers=request_api_headers,
+                json=json_payload
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            bind_tenant_from_auth_response(data, juspay_creds)
+            context = data.get("context")
+            # Check if context is JUSPAY
+            isadmin = context == "JUSPAY"
+
+            valid_host = data.get("validHost")
+            if not valid_host:
+                raise Exception("validHost not found in Juspay token validation response.")
+            if not valid_host.startswith("http"):
+                valid_host = f"https://{valid_host}"
+            
+            return valid_host, isadmin
     except Exception as e:
-        logger.error(f"Token validation failed: {e}")
+        logger.error("Token validation failed: %s", e)
         raise
     
 def ist_to_utc(ist_time_string, format="%Y-%m-%dT%H:%M:%SZ"):
@@ -339,7 +375,7 @@ def ist_to_utc(ist_time_string, format="%Y-%m-%dT%H:%M:%SZ"):
 
         return utc_time.strftime(format)
     except Exception as e:
-        logging.error(f"Error converting ist to utc: {str(e)}")
+        logging.error("Error converting ist to utc: %s", e)
         # If it's already a datetime, try to return a formatted string
         if isinstance(ist_time_string, datetime):
             return ist_time_string.strftime(format)
@@ -359,10 +395,10 @@ def utc_to_ist(utc_time_string: str) -> str:
         ist_time = utc_time + ist_offset
         return ist_time.strftime("%Y-%m-%dT%H:%M:%SZ")
     except Exception as e:
-        logging.error(f"Error converting utc to ist: {str(e)}")
+        logging.error("Error converting utc to ist: %s", e)
         return utc_time_string
     
-MERCHANT_ID_PLACEHOLDERS = [
+MERCHANT_ID_PLACEHOLDERS = frozenset({
     'prompt_user_if_needed', 
     'PROMPT_USER', 
     'prompt_user',
@@ -372,7 +408,7 @@ MERCHANT_ID_PLACEHOLDERS = [
     'REQUIRED',
     '',
     None
-]    
+})
 
 def sanitize_merchant_id(merchant_id_from_payload: str, mid_from_meta: str) -> str:
     """
@@ -388,6 +424,6 @@ def sanitize_merchant_id(merchant_id_from_payload: str, mid_from_meta: str) -> s
     """
     # Check if payload merchantId is a placeholder value
     if merchant_id_from_payload in MERCHANT_ID_PLACEHOLDERS:
-        logger.info(f"merchantId from payload '{merchant_id_from_payload}' is a placeholder, using meta_info value: {mid_from_meta}")
+        logger.info("merchantId from payload '%s' is a placeholder, using meta_info value: %s", merchant_id_from_payload, mid_from_meta)
         return mid_from_meta
     return merchant_id_from_payload or mid_from_meta
\ No newline at end of file
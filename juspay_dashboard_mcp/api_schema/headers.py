@@ -4,10 +4,14 @@
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class WithHeaders(BaseModel):
+    # Inherited by every payload: build the validator/schema on first use
+    # instead of at import, since most tools go unused in a given session.
+    model_config = ConfigDict(defer_build=True)
+
     # cookie: str = Field(
     #     ...,
     #     description="Authentication cookie or session token."
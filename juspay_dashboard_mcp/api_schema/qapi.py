@@ -594,6 +594,8 @@ class QApiPayload(BaseModel):
 class ToolQApiPayload(BaseModel):
     """Pydantic model for the Tool Interface Q API payload"""
 
+    model_config = ConfigDict(defer_build=True)
+
     schema_signature: Optional[str] = Field(
         default=None,
         description=(
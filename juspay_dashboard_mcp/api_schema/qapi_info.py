@@ -5,7 +5,7 @@
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
 from typing import List, Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 DomainEnum = Literal[
     "kvorders",
@@ -23,6 +23,8 @@ DomainEnum = Literal[
 
 
 class QApiInfoPayload(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     domain: DomainEnum = Field(
         ...,
         description="Analytics domain to retrieve schema for (dimensions, filters, metrics).",
@@ -45,6 +47,8 @@ class QApiDimensionLookupRequest(BaseModel):
 
 
 class QApiFieldValueDiscoveryPayload(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     schema_signature: Optional[str] = Field(
         default=None,
         description=(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -7,6 +7,8 @@ class JuspayRagQueryPayload(BaseModel):
     Payload schema for RAG query tool.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     query: str = Field(
         ..., description="The question to ask the RAG system", min_length=1
     )
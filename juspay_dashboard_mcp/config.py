@@ -29,6 +29,13 @@ dotenv.load_dotenv()
 
 JUSPAY_ENV = os.getenv("JUSPAY_ENV", "production").lower() 
 JUSPAY_WEB_LOGIN_TOKEN = os.getenv("JUSPAY_WEB_LOGIN_TOKEN")
+# Comma-separated tool names to leave out of the dashboard server.
+JUSPAY_DASHBOARD_IGNORE_TOOL = os.getenv("JUSPAY_DASHBOARD_IGNORE_TOOL", "")
+# Cache read-only configuration tool responses in process (off by default).
+# Even when on, the caller's token is re-validated with Portal on every call.
+JUSPAY_DASHBOARD_RESPONSE_CACHE = os.getenv("JUSPAY_DASHBOARD_RESPONSE_CACHE") == "true"
+# Expose the internal response-cache stats tool (off by default).
+JUSPAY_DASHBOARD_CACHE_STATS_TOOL = os.getenv("JUSPAY_DASHBOARD_CACHE_STATS_TOOL") == "true"
 
 if JUSPAY_ENV == "production":
     JUSPAY_BASE_URL = os.getenv("JUSPAY_PROD_BASE_URL", "https://portal.juspay.in")
@@ -0,0 +1,208 @@
+# Copyright 2025 Juspay
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
+
+"""In-process TTL cache for read-only dashboard configuration tools.
+
+Gateway, settings and surcharge configuration changes on the order of minutes,
+so handle_tool_calls can answer repeat calls for the same credentials and
+payload from memory instead of making another Portal round trip. The cache is
+off unless JUSPAY_DASHBOARD_RESPONSE_CACHE=true, and is per process and bounded.
+
+A cache hit skips the handler, and with it the handler's own token check, so
+handle_tool_calls re-validates the token with Portal before every lookup and
+passes the identity Portal returned (host, admin flag, tenant) to cache_key().
+A revoked or expired token therefore gets an error, never a cached response.
+
+Keys are a BLAKE2b digest of the canonical (sorted-key) JSON of the validated
+identity, credentials, meta_info and payload. Sorting makes equivalent payloads
+share an entry whatever their dict order, and digesting keeps raw tokens out of
+the key table. All of meta_info and the credentials are key-defining: the
+Portal authorises per token, so narrowing the scope to merchant_id or validHost
+could serve one session's response to a token that is not allowed to see it.
+
+Entries outlive their TTL as "stale" copies for STALE_FACTOR x TTL. A stale copy
+is only returned by get_stale(), which handle_tool_calls uses when the Portal API
+is unavailable (see is_upstream_unavailable()), so an outage degrades to slightly
+old configuration instead of an error. 4xx responses, auth failures and tenant
+mismatches are re-raised and never answered from the cache.
+
+Concurrent misses for the same key are coalesced (see coalesce()), so a burst of
+identical calls after an entry expires costs one upstream request.
+
+Hits, misses, stale fallbacks and coalesced calls are counted per tool in
+CACHE_METRICS and summarised in the log every _LOG_EVERY lookups, so the TTLs
+below can be tuned from real hit ratios.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from juspay_dashboard_mcp.config import JUSPAY_DASHBOARD_RESPONSE_CACHE
+
+# Tool name -> seconds a cached response stays fresh. Only read-only
+# configuration lookups belong here; orders, outages and anything that
+# creates or updates data must always hit the API.
+CACHEABLE_TOOLS: dict[str, float] = {
+    "juspay_list_configured_gateway": 300,
+    "juspay_get_gateway_scheme": 3600,
+    "juspay_get_gateway_details": 300,
+    "juspay_list_gateway_scheme": 3600,
+    "juspay_get_merchant_gateways_pm_details": 300,
+    "juspay_get_conflict_settings": 300,
+    "juspay_get_general_settings": 300,
+    "juspay_get_mandate_settings": 300,
+    "juspay_get_priority_logic_settings": 300,
+    "juspay_get_routing_settings": 300,
+    "juspay_get_webhook_settings": 300,
+    "juspay_list_surcharge_rules": 300,
+}
+
+logger = logging.getLogger(__name__)
+
+STALE_FACTOR = 10
+_MAX_ENTRIES = 1024
+_LOG_EVERY = 1000
+
+# "hit:<tool>", "miss:<tool>", "stale_served:<tool>", "coalesced:<tool>" -> count
+CACHE_METRICS: Counter[str] = Counter()
+_lookups = 0
+
+# (tool, digest) -> (fresh_until, stale_until, response), least recently used first.
+_entries: OrderedDict[tuple, tuple[float, float, Any]] = OrderedDict()
+
+# key -> the upstream call currently running for it.
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def is_cacheable(tool: str) -> bool:
+    """True when the cache is enabled and `tool` is a cacheable lookup."""
+    return JUSPAY_DASHBOARD_RESPONSE_CACHE and tool in CACHEABLE_TOOLS
+
+
+def cache_key(
+    tool: str,
+    payload: dict,
+    juspay_creds: dict | None,
+    meta_info: dict | None,
+    identity: list,
+) -> tuple | None:
+    """Key for a tool call, or None when the tool is not cacheable.
+
+    `identity` is what Portal returned when the token was just re-validated.
+    """
+    if not is_cacheable(tool):
+        return None
+    scope = json.dumps([identity, juspay_creds, meta_info, payload], sort_keys=True, default=str)
+    return (tool, hashlib.blake2b(scope.encode(), digest_size=16).hexdigest())
+
+
+def get(key: tuple) -> Any | None:
+    """Return the cached response for `key` if it is still fresh."""
+    response = _lookup(key)
+    _record("hit" if response is not None else "miss", key[0])
+
+    global _lookups
+    _lookups += 1
+    if _lookups % _LOG_EVERY == 0:
+        logger.info("Dashboard response cache after %d lookups: %s", _lookups, stats())
+    return response
+
+
+def _lookup(key: tuple) -> Any | None:
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    fresh_until, stale_until, response = entry
+    now = time.monotonic()
+    if now >= stale_until:
+        del _entries[key]
+        return None
+    if now >= fresh_until:
+        return None
+    _entries.move_to_end(key)
+    return response
+
+
+def get_stale(key: tuple) -> Any | None:
+    """Return the cached response for `key`, fresh or stale, if one is retained."""
+    entry = _entries.get(key)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    _record("stale_served", key[0])
+    return entry[2]
+
+
+def is_upstream_unavailable(exc: BaseException) -> bool:
+    """True when `exc`, or an exception it was raised from, is a transport
+    failure or a 5xx from the API - the only errors a stale copy may cover.
+    """
+    while exc is not None:
+        if isinstance(exc, httpx.TransportError):
+            return True
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        exc = exc.__cause__
+    return False
+
+
+def put(key: tuple, response: Any) -> None:
+    """Store a successful response under `key` for its tool's TTL."""
+    if response is None:
+        return
+    ttl = CACHEABLE_TOOLS[key[0]]
+    now = time.monotonic()
+    _entries[key] = (now + ttl, now + ttl * STALE_FACTOR, response)
+    _entries.move_to_end(key)
+    while len(_entries) > _MAX_ENTRIES:
+        _entries.popitem(last=False)
+
+
+async def coalesce(key: tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Await `call()`, sharing one in-flight call among concurrent callers of `key`.
+
+    The call runs as its own task, so a caller that is cancelled does not cancel
+    it for the others still waiting on the same key.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _finish_inflight(key, t))
+    else:
+        _record("coalesced", key[0])
+    return await asyncio.shield(task)
+
+
+def _finish_inflight(key: tuple, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark the exception retrieved even if every waiter was cancelled.
+        task.exception()
+
+
+def _record(event: str, tool: str) -> None:
+    CACHE_METRICS[f"{event}:{tool}"] += 1
+
+
+def stats() -> dict:
+    """Counters plus current size, for logs and the cache stats tool."""
+    return {
+        "metrics": dict(CACHE_METRICS),
+        "entries": len(_entries),
+        "inflight": len(_inflight),
+    }
+
+
+def clear() -> None:
+    _entries.clear()
@@ -6,12 +6,10 @@
 
 import json
 import mcp.types as types
-import inspect
 import logging
 import os
 import time
 from mcp.server.lowlevel import Server
-from mcp.server.sse import SseServerTransport
 
 from juspay_mcp.analytics import record_tool_call
 from juspay_mcp.analytics.config import is_local_development
@@ -19,11 +17,14 @@ from juspay_mcp.analytics.identity import (
     extract_mid as extract_analytics_mid,
     resolve_mid_from_dashboard_token,
 )
-from juspay_dashboard_mcp import response_schema
-from juspay_dashboard_mcp.api import *
-import juspay_dashboard_mcp.api_schema as api_schema
 import juspay_dashboard_mcp.utils as util
-from juspay_dashboard_mcp.config import JUSPAY_BASE_URL
+from juspay_mcp import tool_utils
+from juspay_dashboard_mcp import response_cache
+from juspay_dashboard_mcp.config import (
+    JUSPAY_BASE_URL,
+    JUSPAY_DASHBOARD_CACHE_STATS_TOOL,
+    JUSPAY_DASHBOARD_IGNORE_TOOL,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +74,16 @@ async def _mid_for_analytics(
     )
 
 
+# Built once and reused for every response: compact separators keep large
+# order/gateway payloads small. Non-JSON values still raise, as json.dumps did.
+_encode_response = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _text_result(text: str) -> list[types.TextContent]:
+    # The text is always a str we built ourselves, so skip pydantic validation.
+    return [types.TextContent.model_construct(type="text", text=text)]
+
+
 async def _safe_record_tool_call(
     *,
     tool: str,
@@ -102,8 +113,23 @@ async def _safe_record_tool_call(
         logger.exception("Failed to emit dashboard analytics event for %s", tool)
 
 
-AVAILABLE_TOOLS = [
-    util.make_api_config(
+async def _validated_identity(meta_info: dict | None) -> list:
+    """Re-validate the caller's token with Portal and return who it belongs to.
+
+    Raises when the token is invalid or bound to another tenant/host.
+    """
+    # Import here to avoid circular imports
+    from juspay_dashboard_mcp.api.utils import get_admin_host
+    from juspay_dashboard_mcp.config import get_tenant_account_id
+
+    host, is_admin = await get_admin_host(meta_info=meta_info)
+    return [host, is_admin, get_tenant_account_id()]
+
+
+# Tool specs hold the model and handler as "<module>.<name>" paths, so a tool
+# listed in JUSPAY_DASHBOARD_IGNORE_TOOL never imports its schema or API module.
+_TOOL_SPECS = [
+    dict(
         name="juspay_get_merchant_details",
         description="""Return merchant and user session details for the authenticated caller.
 
@@ -112,10 +138,10 @@ Key features:
 - Takes no input — all information is derived from the active session.
 
 Use this when the user asks who they are, which merchant or tenant they're logged in as, what their merchant ID / user ID / tenant ID is, or to confirm session context before performing privileged actions.""",
-        model=api_schema.account.JuspayGetMerchantDetailsPayload,
-        handler=account.get_merchant_details_juspay,
+        model="account.JuspayGetMerchantDetailsPayload",
+        handler="account.get_merchant_details_juspay",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_configured_gateway",
         description="""Use this tool when asked about the list of payment gateways . Retrieves a list of all payment gateways (PGs) configured for a merchant, including high-level details such as gateway reference ID, creation/modification dates, configured payment methods (PMs) and configured payment flows. Note: Payment Method Types (PMTs), configured EMI plans, configured mandate/subscriptions payment methods (PMs) and configured TPV PMs are not included in the response.
 
@@ -127,11 +153,11 @@ Key features:
 - Details the payment flows enabled for each gateway.
 
 Use this tool to get an overview of all active payment gateways for a merchant, understand which payment methods are configured on each gateway, and check basic configuration details. Essential for gateway management and initial diagnostics.""",
-        model=api_schema.gateway.JuspayListConfiguredGatewaysPayload,
-        handler=gateway.list_configured_gateways_juspay,
-        response_schema=response_schema.list_configured_gateways_response_schema,
+        model="gateway.JuspayListConfiguredGatewaysPayload",
+        handler="gateway.list_configured_gateways_juspay",
+        response_schema="list_configured_gateways_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_gateway_scheme",
         description="""Use this tool when asked about configuration information about a particular gateway . This API provides detailed configuration information for a gateway, including required/optional fields, supported payment methods and supported features/payment flows for that gateway.
 
@@ -142,11 +168,11 @@ Key features:
 - Details supported features and payment flows (e.g., 3DS, AFT, etc.).
 
 Use this tool to understand the configuration requirements and capabilities of a specific payment gateway before or during integration. Helpful for developers and integration engineers.""",
-        model=api_schema.gateway.JuspayGetGatewaySchemePayload,
-        handler=gateway.get_gateway_scheme_juspay,
-        response_schema=response_schema.get_gateway_scheme_response_schema,
+        model="gateway.JuspayGetGatewaySchemePayload",
+        handler="gateway.get_gateway_scheme_juspay",
+        response_schema="get_gateway_scheme_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_gateway_details",
         description="""Use this tool when asked about detailed information about any gateway and mga_id is provided.This API returns detailed information about a specific gateway configured by the merchant. Requires mga_id which can be fetched from juspay_list_configured_gateway. This API returns all details of the gateway including payment methods (PM), EMI plans, mandate/subscriptions payment methods (PMs) and TPV PMs along with configured payment flows. Note: This API does not return payment method type (PMT) for each configured payment method.
 
@@ -159,11 +185,11 @@ Key features:
 - Shows all configured payment flows.
 
 Use this tool to get a complete picture of a specific configured gateway, including all its payment methods and special configurations. Essential for deep-dive analysis and troubleshooting of a particular gateway setup.""",
-        model=api_schema.gateway.JuspayGetGatewayDetailsPayload,
-        handler=gateway.get_gateway_details_juspay,
-        response_schema=response_schema.get_gateway_details_response_schema,
+        model="gateway.JuspayGetGatewayDetailsPayload",
+        handler="gateway.get_gateway_details_juspay",
+        response_schema="get_gateway_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_gateway_scheme",
         description="""This API returns a list of all available payment gateways that can be configured on PGCC. Doesn't contain any details only a list of available gateways for configuration on PGCC.
 
@@ -173,11 +199,11 @@ Key features:
 - No detailed configuration information is included.
 
 Use this tool to discover which payment gateways are available to be configured for a merchant on the Juspay platform. Useful for initial setup and exploring new gateway options.""",
-        model=api_schema.gateway.JuspayListGatewaySchemePayload,
-        handler=gateway.list_gateway_scheme_juspay,
-        response_schema=response_schema.list_gateway_scheme_response_schema,
+        model="gateway.JuspayListGatewaySchemePayload",
+        handler="gateway.list_gateway_scheme_juspay",
+        response_schema="list_gateway_scheme_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_merchant_gateways_pm_details",
         description="""This API fetches all gateways and their supported payment methods configured for the merchant. Only this API will give payment method type (PMT) for each configured payment method. Doesn't include any other details except for gateway wise configured payment methods with payment method type.
 
@@ -187,11 +213,11 @@ Key features:
 - Crucially, provides the Payment Method Type (PMT) for each payment method.
 
 Use this tool specifically when you need to know the Payment Method Type (PMT) for configured payment methods on each gateway. This is the only tool that provides this specific piece of information.""",
-        model=api_schema.gateway.JuspayGetMerchantGatewaysPmDetailsPayload,
-        handler=gateway.get_merchant_gateways_pm_details_juspay,
-        response_schema=response_schema.get_merchant_gateways_pm_details_response_schema,
+        model="gateway.JuspayGetMerchantGatewaysPmDetailsPayload",
+        handler="gateway.get_merchant_gateways_pm_details_juspay",
+        response_schema="get_merchant_gateways_pm_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_report_details",
         description="""This API returns detailed information for a specific report ID, including data sources, metrics, dimensions, and filters.
 
@@ -202,11 +228,11 @@ Key features:
 - Details the filters applied to the report data.
 
 Use this tool to understand how a specific report is constructed, what data it contains, and how it is filtered. Essential for validating report data and understanding its scope.""",
-        model=api_schema.report.JuspayReportDetailsPayload,
-        handler=report.report_details_juspay,
-        response_schema=response_schema.report_details_response_schema,
+        model="report.JuspayReportDetailsPayload",
+        handler="report.report_details_juspay",
+        response_schema="report_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_report",
         description="""This API lists all reports configured by the merchant, along with their status, recipients, thresholds, and monitoring intervals.
 
@@ -218,11 +244,11 @@ Key features:
 - Provides the monitoring or generation interval for each report.
 
 Use this tool to get an overview of all configured reports, check their status, and see who receives them. Useful for managing reporting and alerting configurations.""",
-        model=api_schema.report.JuspayListReportPayload,
-        handler=report.list_report_juspay,
-        response_schema=response_schema.list_report_response_schema,
+        model="report.JuspayListReportPayload",
+        handler="report.list_report_juspay",
+        response_schema="list_report_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_offer_details",
         description="""This API retrieves detailed information for a specific offer including eligibility rules, benefit types, and configurations.
 
@@ -233,11 +259,11 @@ Key features:
 - Provides all associated configurations.
 
 Use this tool to understand the exact mechanics of a specific offer. Essential for troubleshooting offer application issues, verifying offer setup, and for customer support inquiries about a specific promotion.""",
-        model=api_schema.offer.JuspayGetOfferDetailsPayload,
-        handler=offer.get_offer_details_juspay,
-        response_schema=response_schema.get_offer_details_response_schema,
+        model="offer.JuspayGetOfferDetailsPayload",
+        handler="offer.get_offer_details_juspay",
+        response_schema="get_offer_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_offers",
         description="""This API lists all offers configured by the merchant, with details such as status, payment methods, offer codes, and validity periods. Requires `sort_offers` (e.g., {"field": "CREATED_AT", "order": "DESCENDING"}).
 
@@ -250,11 +276,11 @@ Key features:
 - Supports sorting to organize the results.
 
 Use this tool to get an overview of all available offers, check their status, and see their high-level applicability. Useful for marketing teams, and for getting a list of active promotions.""",
-        model=api_schema.offer.JuspayListOffersPayload,
-        handler=offer.list_offers_juspay,
-        response_schema=response_schema.list_offers_response_schema,
+        model="offer.JuspayListOffersPayload",
+        handler="offer.list_offers_juspay",
+        response_schema="list_offers_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_user",
         description="""This API fetches details for a specific user, identified by user ID.
 
@@ -263,11 +289,11 @@ Key features:
 - Includes details associated with the user account.
 
 Use this tool to look up the details of a specific user on the dashboard. Essential for user management and verifying user permissions.""",
-        model=api_schema.user.JuspayGetUserPayload,
-        handler=user.get_user_juspay,
-        response_schema=response_schema.get_user_response_schema,
+        model="user.JuspayGetUserPayload",
+        handler="user.get_user_juspay",
+        response_schema="get_user_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_users_v2",
         description="""This API retrieves a list of users associated with a merchant, with optional pagination.
 
@@ -277,11 +303,11 @@ Key features:
 - Supports pagination to handle large numbers of users.
 
 Use this tool to get a list of all dashboard users for a merchant. Useful for auditing user access and managing user accounts.""",
-        model=api_schema.user.JuspayListUsersV2Payload,
-        handler=user.list_users_v2_juspay,
-        response_schema=response_schema.list_users_v2_response_schema,
+        model="user.JuspayListUsersV2Payload",
+        handler="user.list_users_v2_juspay",
+        response_schema="list_users_v2_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_conflict_settings",
         description="""This API retrieves conflict settings configuration for payment processing.
 
@@ -289,11 +315,11 @@ Key features:
 - Fetches the current conflict settings for the merchant.
 
 Use this tool to check the conflict settings configuration for payment processing. Essential for developers and operations teams.""",
-        model=api_schema.settings.JuspayConflictSettingsPayload,
-        handler=settings.get_conflict_settings_juspay,
-        response_schema=response_schema.get_conflict_settings_response_schema,
+        model="settings.JuspayConflictSettingsPayload",
+        handler="settings.get_conflict_settings_juspay",
+        response_schema="get_conflict_settings_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_general_settings",
         description="""This API retrieves general configuration settings for the merchant.
 
@@ -301,11 +327,11 @@ Key features:
 - Fetches a wide range of general account settings for the merchant.
 
 Use this tool to get a broad overview of the merchant's primary configuration on Juspay. Useful for verifying basic setup and feature enablement.""",
-        model=api_schema.settings.JuspayGeneralSettingsPayload,
-        handler=settings.get_general_settings_juspay,
-        response_schema=response_schema.get_general_settings_response_schema,
+        model="settings.JuspayGeneralSettingsPayload",
+        handler="settings.get_general_settings_juspay",
+        response_schema="get_general_settings_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_mandate_settings",
         description="""This API retrieves mandate-related settings for recurring payments.
 
@@ -313,11 +339,11 @@ Key features:
 - Fetches all settings related to payment mandates for recurring payments.
 
 Use this tool to understand how recurring payments and subscriptions are configured for the merchant. Essential for managing subscription-based services.""",
-        model=api_schema.settings.JuspayMandateSettingsPayload,
-        handler=settings.get_mandate_settings_juspay,
-        response_schema=response_schema.get_mandate_settings_response_schema,
+        model="settings.JuspayMandateSettingsPayload",
+        handler="settings.get_mandate_settings_juspay",
+        response_schema="get_mandate_settings_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_priority_logic_settings",
         description="""This API fetches a list of all configured priority logic rules, including their current status and full logic definition.
 
@@ -327,11 +353,11 @@ Key features:
 - Provides the complete logical definition of each rule.
 
 Use this tool to understand how payment gateways are prioritized for routing transactions. Essential for analyzing and troubleshooting payment routing decisions.""",
-        model=api_schema.settings.JuspayPriorityLogicSettingsPayload,
-        handler=settings.get_priority_logic_settings_juspay,
-        response_schema=response_schema.get_priority_logic_settings_response_schema,
+        model="settings.JuspayPriorityLogicSettingsPayload",
+        handler="settings.get_priority_logic_settings_juspay",
+        response_schema="get_priority_logic_settings_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_routing_settings",
         description="""This API provides details of success rate-based routing thresholds defined by the merchant, including enablement status and downtime-based switching thresholds.
 
@@ -342,11 +368,11 @@ Key features:
 - Provides configuration for downtime-based gateway switching.
 
 Use this tool to check the configuration of automated, performance-based payment routing. Crucial for understanding how the system optimizes transaction success rates.""",
-        model=api_schema.settings.JuspayRoutingSettingsPayload,
-        handler=settings.get_routing_settings_juspay,
-        response_schema=response_schema.get_routing_settings_response_schema,
+        model="settings.JuspayRoutingSettingsPayload",
+        handler="settings.get_routing_settings_juspay",
+        response_schema="get_routing_settings_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_webhook_settings",
         description="""This API retrieves webhook configuration settings for the merchant.
 
@@ -354,11 +380,11 @@ Key features:
 - Fetches the webhook configuration settings.
 
 Use this tool to verify webhook configurations and troubleshoot notification delivery issues. Essential for developers integrating with Juspay's event system.""",
-        model=api_schema.settings.JuspayWebhookSettingsPayload,
-        handler=settings.get_webhook_settings_juspay,
-        response_schema=response_schema.get_webhook_settings_response_schema,
+        model="settings.JuspayWebhookSettingsPayload",
+        handler="settings.get_webhook_settings_juspay",
+        response_schema="get_webhook_settings_response_schema",
     ),
-#     util.make_api_config(
+#     dict(
 #         name="juspay_update_webhook_settings",
 #         description="""Update the merchant's webhook URL and event subscriptions.
 
@@ -372,10 +398,10 @@ Use this tool to verify webhook configurations and troubleshoot notification del
 # - Advanced webhook config fields (custom webhook URL routes, JWT key references, full-gateway-response toggle, SSL-cert-based webhooks) are reset to defaults by this tool. Don't use it on merchants that depend on those — modify those via the dashboard instead.
 
 # Use this when the user asks to configure webhooks, set their webhook URL, or change which Juspay events they receive.""",
-#         model=api_schema.settings.JuspayUpdateWebhookSettingsPayload,
-#         handler=settings.update_webhook_settings_juspay,
+#         model="settings.JuspayUpdateWebhookSettingsPayload",
+#         handler="settings.update_webhook_settings_juspay",
 #     ),
-    util.make_api_config(
+    dict(
         name="juspay_create_api_key",
         description="""Generate a new API key for the authenticated merchant.
 
@@ -386,10 +412,10 @@ Key features:
 - Returns: id, status (ACTIVE), apiKey, maskedApiKey, scope, dateCreated, lastUpdated, merchantAccountId, version, metadata.
 
 Use this when the user asks to generate, mint, or provision a Juspay API key for server-to-server payment API access. Warn the user that the plaintext key cannot be retrieved later — it must be saved at creation time.""",
-        model=api_schema.api_keys.JuspayCreateApiKeyPayload,
-        handler=api_keys.create_api_key_juspay,
+        model="api_keys.JuspayCreateApiKeyPayload",
+        handler="api_keys.create_api_key_juspay",
     ),
-#     util.make_api_config(
+#     dict(
 #         name="juspay_update_general_settings",
 #         description="""Update the merchant's general settings.
 
@@ -399,10 +425,10 @@ Use this when the user asks to generate, mint, or provision a Juspay API key for
 # - No client-side validation on the value.
 
 # Use this when the user asks to set, change, or clear the payment redirect URL / return URL for their merchant account.""",
-#         model=api_schema.settings.JuspayUpdateGeneralSettingsPayload,
-#         handler=settings.update_general_settings_juspay,
+#         model="settings.JuspayUpdateGeneralSettingsPayload",
+#         handler="settings.update_general_settings_juspay",
 #     ),
-    util.make_api_config(
+    dict(
         name="juspay_alert_details",
         description="""Provides detailed information for a specific alert ID, including source, monitored metrics, and applied filters.
 
@@ -413,11 +439,11 @@ Key features:
 - Shows the applied filters that trigger the alert.
 
 Use this tool to understand why a specific alert was triggered or to review the exact configuration of an alert. Essential for operations teams and developers responsible for system monitoring.""",
-        model=api_schema.alert.JuspayAlertDetailsPayload,
-        handler=alert.alert_details_juspay,
-        response_schema=response_schema.alert_details_response_schema,
+        model="alert.JuspayAlertDetailsPayload",
+        handler="alert.alert_details_juspay",
+        response_schema="alert_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_alerts",
         description="""Retrieves all alerts configured by the merchant, including their status, recipients, thresholds, and monitoring intervals.
 
@@ -429,11 +455,11 @@ Key features:
 - Provides the monitoring interval for each alert.
 
 Use this tool to get a complete overview of the monitoring and alerting setup for the merchant. Useful for auditing alerts and managing notification configurations.""",
-        model=api_schema.alert.JuspayListAlertsPayload,
-        handler=alert.list_alerts_juspay,
-        response_schema=response_schema.list_alerts_response_schema,
+        model="alert.JuspayListAlertsPayload",
+        handler="alert.list_alerts_juspay",
+        response_schema="list_alerts_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_orders_v4",
         description="""Retrieves a list of orders created within a specified time range. Supports an optional top-level 'limit' parameter and optional 'flatFilters' for payment status and order type.Domain is a mandatory field for this tool and should always be provided . If unsure about the domain, use 'txnsELS' as the default value.
 
@@ -445,11 +471,11 @@ Key features:
 - Requires a 'domain' parameter, typically 'txnsELS'.
 
 Use this tool to search for orders based on time, status, or type. Essential for generating order reports, reconciling transactions, and getting a high-level view of order activity.""",
-        model=api_schema.orders.JuspayListOrdersV4Payload,
-        handler=orders.list_orders_v4_juspay,
-        response_schema=response_schema.list_orders_v4_response_schema,
+        model="orders.JuspayListOrdersV4Payload",
+        handler="orders.list_orders_v4_juspay",
+        response_schema="list_orders_v4_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_get_order_details",
         description="""Returns complete details for a given order ID. 
 
@@ -475,11 +501,11 @@ Key features:
 
 
 Use this tool to look up the status of a specific payment, troubleshoot a customer's order issue, verify transaction details for reconciliation, or fetch data for customer support inquiries. Essential for support teams, operations personnel, and developers who need to inspect the state of individual orders.""",
-        model=api_schema.orders.JuspayGetOrderDetailsPayload,
-        handler=orders.get_order_details_juspay,
-        response_schema=response_schema.get_order_details_response_schema,
+        model="orders.JuspayGetOrderDetailsPayload",
+        handler="orders.get_order_details_juspay",
+        response_schema="get_order_details_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_payment_links_v1",
         description="""Retrieves a list of payment links created within a specified time range (mandatory). Supports filters from the transactions (txns) domain such as payment_status and order_type.
 
@@ -489,11 +515,11 @@ Key features:
 - Supports filtering by order type.
 
 Use this tool to search for payment links, check their status, or generate reports on link usage. Useful for support teams and for tracking payments made via links.""",
-        model=api_schema.payments.JuspayListPaymentLinksV1Payload,
-        handler=payments.list_payment_links_v1_juspay,
-        response_schema=response_schema.list_payment_links_v1_response_schema,
+        model="payments.JuspayListPaymentLinksV1Payload",
+        handler="payments.list_payment_links_v1_juspay",
+        response_schema="list_payment_links_v1_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_list_surcharge_rules",
         description="""No input required. Returns a list of all configured surcharge rules, including their current status and rule definitions.
 
@@ -503,18 +529,18 @@ Key features:
 - Provides the full definition of each rule.
 
 Use this tool to review and audit all configured surcharge rules. Essential for understanding how and when additional fees are applied to transactions.""",
-        model=api_schema.surcharge.JuspayListSurchargeRulesPayload,
-        handler=surcharge.list_surcharge_rules_juspay,
-        response_schema=response_schema.list_surcharge_rules_response_schema,
+        model="surcharge.JuspayListSurchargeRulesPayload",
+        handler="surcharge.list_surcharge_rules_juspay",
+        response_schema="list_surcharge_rules_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="q_api",
-        description=api_schema.qapi.api_description,
-        model=api_schema.qapi.ToolQApiPayload,
-        handler=qapi.q_api,
-        response_schema=response_schema.q_api_response_schema,
+        description_ref="qapi.api_description",
+        model="qapi.ToolQApiPayload",
+        handler="qapi.q_api",
+        response_schema="q_api_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="list_outages_juspay",
         description="""Returns a list of outages within a specified time range.
 
@@ -524,11 +550,11 @@ Key features:
 - Converts outage period timestamps to IST in the response.
 
 Use this tool to check for any service disruptions or performance degradation issues. Essential for monitoring system health and understanding the impact of outages on payment processing.""",
-        model=api_schema.outages.JuspayListOutagesPayload,
-        handler=outages.list_outages_juspay,
-        response_schema=response_schema.list_outages_response_schema,
+        model="outages.JuspayListOutagesPayload",
+        handler="outages.list_outages_juspay",
+        response_schema="list_outages_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="create_payment_link_juspay",
         description="""Use this tool when asked to create a payment link.
 IMPORTANT: You must ask the user for the required fields (amount), do not assume any of these fields always prompt the user.
@@ -543,11 +569,10 @@ Set showEmiOption to true only if any EMI option is requested.
 RECREATE FROM ORDER: If the user asks to recreate a payment link and provides an order ID, first call the 'juspay_get_order_details' tool with that order_id to fetch the existing order details, then use those details (amount, customer information, payment methods, etc.) to create a new payment link with the same parameters.
 CRITICAL : If all the necessary parameters are provided do not ask for confirmation from the user, directly create the payment link.
 """,
-        model=api_schema.payments.JuspayCreatePaymentLinkPayload,
-        handler=payments.create_payment_link_juspay,
-        response_schema=None,
+        model="payments.JuspayCreatePaymentLinkPayload",
+        handler="payments.create_payment_link_juspay",
     ),
-    util.make_api_config(
+    dict(
         name="create_autopay_link_juspay",
         description="""Use this tool when asked to create an autopay payment link or recurring payment link or mandate payment link.
 IMPORTANT: You must ask the user for ALL required fields (amount, mandate_max_amount, mandate_start_date, mandate_end_date, mandate_frequency), do not assume any of these fields always prompt the user.
@@ -561,11 +586,10 @@ Set showEmiOption to true only if any EMI option is requested.
 RECREATE FROM ORDER: If the user asks to recreate an autopay payment link and provides an order ID, first call the 'juspay_get_order_details' tool with that order_id to fetch the existing order details, then use those details (amount, customer information, mandate details, payment methods, etc.) to create a new autopay payment link with the same parameters.
 CRITICAL : If all the necessary parameters are provided do not ask for confirmation from the user, directly create the autopay payment link.
 """,
-        model=api_schema.payments.JuspayCreateAutopayLinkPayload,
-        handler=payments.create_autopay_link_juspay,
-        response_schema=None,
+        model="payments.JuspayCreateAutopayLinkPayload",
+        handler="payments.create_autopay_link_juspay",
     ),
-    util.make_api_config(
+    dict(
         name="qapi_info",
         description="""Step 1 of 3: Discover valid dimensions and metrics for analytics queries.
 
@@ -584,11 +608,11 @@ Key features:
 Supported domains: kvorders, kvtxns, kvrefundtxns, kvoffers, mandateexecutionkv, fulfillmentorders, sdklogs, kvcustomer, kvmandates, unauthtxns, apirequests.
 
 IMPORTANT: Do not summarize the output. The exact field names are required for q_api queries.""",
-        model=api_schema.qapi_info.QApiInfoPayload,
-        handler=qapi_info.qapi_info,
-        response_schema=response_schema.qapi_info_response_schema,
+        model="qapi_info.QApiInfoPayload",
+        handler="qapi_info.qapi_info",
+        response_schema="qapi_info_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="qapi_field_value_discovery",
         description="""Step 2 of 3: Look up valid filter values for specific dimensions.
 
@@ -608,19 +632,19 @@ Key features:
 Supported domains: kvorders, kvtxns, kvrefundtxns, kvoffers, mandateexecutionkv, fulfillmentorders, sdklogs, kvcustomer, kvmandates, unauthtxns, apirequests.
 
 IMPORTANT: Do not summarize the output. Exact values are required for q_api filters.""",
-        model=api_schema.qapi_info.QApiFieldValueDiscoveryPayload,
-        handler=qapi_info.qapi_field_value_discovery,
-        response_schema=response_schema.qapi_field_value_discovery_response_schema,
+        model="qapi_info.QApiFieldValueDiscoveryPayload",
+        handler="qapi_info.qapi_field_value_discovery",
+        response_schema="qapi_field_value_discovery_response_schema",
     ),
-    util.make_api_config(
+    dict(
     name="rag_tool_juspay",
     description="Use this tool when you need to retrieve information about Juspay's products, services, APIs, integration guides, or technical documentation . The Data source for this tool is  https://juspay.io/in/docs (Juspay's Product Documentation) . This tool provides comprehensive info regarding Juspay's product documnetations.",
-    model=api_schema.rag_tool.JuspayRagQueryPayload,
-    handler=rag_tool.query_rag_tool,
-    response_schema=response_schema.rag_query_response_schema,
+    model="rag_tool.JuspayRagQueryPayload",
+    handler="rag_tool.query_rag_tool",
+    response_schema="rag_query_response_schema",
     ),
     # ----- Integration Checklist tools (ported from PR #67) -------------------
-    util.make_api_config(
+    dict(
         name="juspay_integration_monitoring_status",
         description="""Track integration progress across platforms and products for a particular merchant. Use this tool when you need to view passed/failed stages and action items for merchant integrations.
 
@@ -656,11 +680,11 @@ IMPORTANT: Do not summarize the output. Exact values are required for q_api filt
 - Module metadata including platform dependencies and minimum requirements
 
 Use this tool to monitor integration progress, identify failed stages that need attention, and provide actionable guidance for completing merchant integrations.""",
-        model=api_schema.integrationChecklist.JuspayIntegrationStatusPayload,
-        handler=integrationChecklist.get_integration_monitoring_status_juspay,
-        response_schema=response_schema.integration_monitoring_status_response_schema,
+        model="integrationChecklist.JuspayIntegrationStatusPayload",
+        handler="integrationChecklist.get_integration_monitoring_status_juspay",
+        response_schema="integration_monitoring_status_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_x_mid_monitoring",
         description="""Retrieves X-Mid validation monitoring data for merchant transactions.
 
@@ -684,11 +708,11 @@ Response includes:
 - Validation status (PASSED/FAILED) for each API endpoint/shortcode
 
 Use this tool to monitor X-Mid header validation compliance, track validation failures across different API endpoints, and ensure proper X-Mid implementation for merchant transactions.""",
-        model=api_schema.integrationChecklist.JuspayXMidMonitoringPayload,
-        handler=integrationChecklist.get_x_mid_monitoring_juspay,
-        response_schema=response_schema.x_mid_monitoring_response_schema,
+        model="integrationChecklist.JuspayXMidMonitoringPayload",
+        handler="integrationChecklist.get_x_mid_monitoring_juspay",
+        response_schema="x_mid_monitoring_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_integration_platform_metrics",
         description="""Retrieve available platforms for a particular merchant. Returns the list of platforms (Android, iOS, Web) configured for the merchant.
 
@@ -716,11 +740,11 @@ Use this tool to monitor X-Mid header validation compliance, track validation fa
 **Important note:** API typically returns Android, iOS, and Web platforms only. Add Backend separately for full coverage.
 
 Use this tool to get the list of available platforms for a merchant, not for integration status tracking.""",
-        model=api_schema.integrationChecklist.JuspayIntegrationPlatformMetricsPayload,
-        handler=integrationChecklist.get_integration_platform_metrics_juspay,
-        response_schema=response_schema.integration_platform_metrics_response_schema,
+        model="integrationChecklist.JuspayIntegrationPlatformMetricsPayload",
+        handler="integrationChecklist.get_integration_platform_metrics_juspay",
+        response_schema="integration_platform_metrics_response_schema",
     ),
-    util.make_api_config(
+    dict(
         name="juspay_integration_product_count_metrics",
         description="""Analyze integration usage patterns by product type for a particular merchant. Use this tool when you need to understand which integration products are most actively used and their adoption patterns.
 
@@ -750,54 +774,90 @@ Use this tool to get the list of available platforms for a merchant, not for int
 - Platform-specific product integration data
 
 Use this tool to analyze product integration patterns, identify the most actively used integration types, and understand product adoption trends for merchant integrations.""",
-        model=api_schema.integrationChecklist.JuspayIntegrationProductCountMetricsPayload,
-        handler=integrationChecklist.get_integration_product_count_metrics_juspay,
-        response_schema=response_schema.integration_product_count_metrics_response_schema,
+        model="integrationChecklist.JuspayIntegrationProductCountMetricsPayload",
+        handler="integrationChecklist.get_integration_product_count_metrics_juspay",
+        response_schema="integration_product_count_metrics_response_schema",
     ),
 ]
 
+if JUSPAY_DASHBOARD_CACHE_STATS_TOOL:
+    _TOOL_SPECS.append(dict(
+        name="juspay_internal_cache_stats",
+        description="""Operator diagnostics for this MCP server's in-process response cache.
+
+Returns per-tool hit, miss, stale_served and coalesced counts plus the number of cached and in-flight entries. Use only when asked about cache behaviour of the MCP server itself; it does not call any Juspay API.""",
+        model="cache_stats.JuspayCacheStatsPayload",
+        handler="cache_stats.get_cache_stats_juspay",
+    ))
+
+_IGNORED_TOOLS = frozenset(
+    name.strip() for name in JUSPAY_DASHBOARD_IGNORE_TOOL.split(",") if name.strip()
+)
+
+
+def build_tools(ignored: frozenset[str] = _IGNORED_TOOLS) -> dict[str, util.ToolConfig]:
+    """Build the tool table from _TOOL_SPECS, skipping the `ignored` names."""
+    return {
+        spec["name"]: util.make_api_config(**spec)
+        for spec in _TOOL_SPECS
+        if spec["name"] not in ignored
+    }
+
+
+AVAILABLE_TOOLS = build_tools()
+
+# AVAILABLE_TOOLS is fixed once the module is imported, so the tool list is
+# built on the first list_tools request and reused for every later session.
+_LIST_TOOLS_CACHE: list[types.Tool] | None = None
+
 @app.list_tools()
 async def list_my_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name=tool["name"],
-            description=tool["description"],
-            inputSchema=tool["schema"],
-        )
-        for tool in AVAILABLE_TOOLS
-    ]
+    global _LIST_TOOLS_CACHE
+    if _LIST_TOOLS_CACHE is None:
+        _LIST_TOOLS_CACHE = [
+            types.Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema=tool_utils.tool_schema(tool.model),
+            )
+            for tool in AVAILABLE_TOOLS.values()
+        ]
+    return _LIST_TOOLS_CACHE
 
 @app.call_tool()
 async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextContent]:
     started_at = time.perf_counter()
-    analytics_arguments = dict(arguments or {})
+    # Work on a copy so popping juspay_meta_info never mutates the caller's dict.
+    arguments = dict(arguments or {})
+    analytics_arguments = dict(arguments)
     logger.info("Tool called: %s", name)
     try:
+        tool_entry = AVAILABLE_TOOLS.get(name)
+        if not tool_entry:
+            raise ValueError(f"Unknown tool: {name}")
+
         # Import here to avoid circular imports
         from juspay_dashboard_mcp.api.utils import set_juspay_credentials
         from juspay_dashboard_mcp.config import set_tenant_account_id
 
-        tool_entry = next((t for t in AVAILABLE_TOOLS if t["name"] == name), None)
-        if not tool_entry:
-            raise ValueError(f"Unknown tool: {name}")
-
-        schema = tool_entry["schema"]
-        required = schema.get("required", [])
-        missing = [key for key in required if key not in arguments]
+        missing = tool_utils.required_fields(tool_entry.model) - arguments.keys()
         if missing:
-            raise ValueError(f"Missing required fields for {name}: {missing}")
+            raise ValueError(f"Missing required fields for {name}: {sorted(missing)}")
 
-        handler = tool_entry["handler"]
-        if not handler:
+        if not tool_entry.handler:
             raise ValueError(f"No handler defined for tool: {name}")
+        invoke = tool_utils.resolve_handler(tool_entry.handler, "juspay_dashboard_mcp.api")
+
+        # Taken out before validation so models with extra="allow" don't pick it up.
+        meta_info = arguments.pop("juspay_meta_info", None)
 
-        model_cls = tool_entry.get("model")
+        model_cls = tool_entry.model
         if (model_cls):
             try:
-                payload = model_cls(**arguments)
-                payload_dict = payload.dict(exclude_none=True)
+                payload = model_cls.model_validate(arguments)
+                payload_dict = payload.model_dump(exclude_none=True)
             except Exception as e:
-                raise ValueError(f"Validation error: {str(e)}")
+                raise ValueError(f"Validation error: {tool_utils.validation_message(e)}")
         else:
             payload_dict = arguments
 
@@ -811,25 +871,38 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
             logger.info("No header credentials found, falling back to environment variables")
             set_juspay_credentials(None)
 
-        meta_info = arguments.pop("juspay_meta_info", None)
-
-        sig = inspect.signature(handler)
-        param_count = len(sig.parameters)
-
-        if param_count == 0:
-            response = await handler()
-
-        elif param_count == 1:
-            if payload_dict or not meta_info:
-                response = await handler(payload_dict)
+        cache_key = None
+        if response_cache.is_cacheable(name):
+            # A hit skips the handler's own token check, so re-validate first.
+            identity = await _validated_identity(meta_info)
+            cache_key = response_cache.cache_key(name, payload_dict, juspay_creds, meta_info, identity)
+        response = response_cache.get(cache_key) if cache_key else None
+        if response is None:
+            try:
+                if cache_key:
+                    response = await response_cache.coalesce(
+                        cache_key, lambda: invoke(payload_dict, meta_info)
+                    )
+                else:
+                    response = await invoke(payload_dict, meta_info)
+            except Exception as e:
+                # Only an unavailable upstream may be covered by a stale copy;
+                # 4xx, auth and tenant errors must reach the caller.
+                stale = None
+                if cache_key and response_cache.is_upstream_unavailable(e):
+                    stale = response_cache.get_stale(cache_key)
+                if stale is None:
+                    raise
+                logger.warning("Serving stale cached response for %s after error: %s", name, e)
+                # Label every stale response; non-dict payloads are wrapped so
+                # the marker can't be lost.
+                if isinstance(stale, dict):
+                    response = {**stale, "x-cache": "stale"}
+                else:
+                    response = {"x-cache": "stale", "response": stale}
             else:
-                response = await handler(meta_info)
-
-        elif param_count == 2:
-            response = await handler(payload_dict, meta_info)
-
-        else:
-            raise ValueError(f"Unsupported number of parameters in tool handler: {param_count}")
+                if cache_key:
+                    response_cache.put(cache_key, response)
         await _safe_record_tool_call(
             tool=name,
             status="success",
@@ -839,10 +912,10 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
             juspay_creds=juspay_creds,
             meta_info=meta_info,
         )
-        return [types.TextContent(type="text", text=json.dumps(response))]
+        return _text_result(_encode_response(response))
 
     except Exception as e:
-        logger.error(f"Error in tool execution: {e}")
+        logger.error("Error in tool execution: %s", e)
         await _safe_record_tool_call(
             tool=name,
             status="error",
@@ -851,4 +924,5 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
             juspay_creds=get_juspay_request_credentials(),
             error=str(e),
         )
-        return [types.TextContent(type="text", text=f"ERROR: Tool execution failed: {str(e)}")]
+        return _text_result(f"ERROR: Tool execution failed: {str(e)}")
+
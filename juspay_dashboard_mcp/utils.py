@@ -4,18 +4,42 @@
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
+import importlib
 import json
 import os
+from dataclasses import dataclass
 
-def make_api_config(name, description, model, handler, response_schema=None):
+INCLUDE_RESPONSE_SCHEMA = os.getenv("INCLUDE_RESPONSE_SCHEMA") == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolConfig:
+    name: str
+    description: str
+    model: type
+    handler: str
+
+
+def _schema_attr(path):
+    """Look up a "<module>.<name>" path under juspay_dashboard_mcp.api_schema."""
+    module_name, _, attr = path.rpartition(".")
+    return getattr(importlib.import_module(f"juspay_dashboard_mcp.api_schema.{module_name}"), attr)
+
+
+def make_api_config(name, model, handler, description=None, response_schema=None, description_ref=None):
+    """Build a tool entry.
+
+    model is a "<module>.<class>" path under juspay_dashboard_mcp.api_schema.
+    A description kept in a schema module is given as description_ref, a
+    "<module>.<name>" path there, so it is only imported for tools being built.
+    response_schema is the name of a schema in juspay_dashboard_mcp.response_schema.
+    That module is large and only read when INCLUDE_RESPONSE_SCHEMA is enabled.
+    """
+    model = _schema_attr(model)
+    if description_ref:
+        description = _schema_attr(description_ref)
     desc = description.strip()
-    INCLUDE_RESPONSE_SCHEMA = os.getenv("INCLUDE_RESPONSE_SCHEMA")
-    if INCLUDE_RESPONSE_SCHEMA == "true" and response_schema:
-        desc += f"\nReturns response following this schema:\n{json.dumps(response_schema, indent=2)}"
-    return {
-        "name": name,
-        "description": desc,
-        "model": model,
-        "schema": model.model_json_schema(),
-        "handler": handler,
-    }
+    if INCLUDE_RESPONSE_SCHEMA and response_schema:
+        schema = getattr(importlib.import_module("juspay_dashboard_mcp.response_schema"), response_schema)
+        desc += f"\nReturns response following this schema:\n{json.dumps(schema, indent=2)}"
+    return ToolConfig(name, desc, model, handler)
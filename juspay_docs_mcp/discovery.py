@@ -175,15 +175,17 @@ async def _validate_url(
         try:
             resp = await client.get(url, timeout=HTTP_TIMEOUT)
             resp.raise_for_status()
-            text = resp.text
+            body = resp.content
         except (httpx.HTTPError, httpx.TimeoutException) as e:
             logger.warning("Validation request failed for %s: %s", url, e)
             return False
 
-        if len(text) < REAL_LLMS_MIN_BYTES:
-            logger.info("Dropping stub (size=%d): %s", len(text), url)
+        # Only the size and the title line matter, so check the raw bytes and
+        # decode just the first line rather than the whole multi-KB file.
+        if len(body) < REAL_LLMS_MIN_BYTES:
+            logger.info("Dropping stub (size=%d): %s", len(body), url)
             return False
-        first_line = text.split("\n", 1)[0]
+        first_line = body.split(b"\n", 1)[0].decode(resp.encoding or "utf-8", "replace")
         if REAL_TITLE_MARKER not in first_line:
             logger.info("Dropping stub (title=%r): %s", first_line[:80], url)
             return False
@@ -273,7 +275,9 @@ async def refresh_and_save() -> list[dict]:
     sources = await _discover_async()
     if not sources:
         raise RuntimeError("Live discovery returned 0 sources")
-    save_snapshot(sources)
+    # Runs while the server is serving; keep the JSON dump and disk write off
+    # the event loop.
+    await asyncio.to_thread(save_snapshot, sources)
     return sources
 
 
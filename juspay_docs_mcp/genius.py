@@ -56,6 +56,30 @@ _HEADERS = {
     "User-Agent": "juspay-docs-mcp",
 }
 
+# One client for every question, so repeat calls reuse the keep-alive
+# connection to juspay.io instead of a fresh TCP+TLS handshake each time.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Genius client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=5),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared Genius client (called via server.close_http_client)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def _public_url(title: str) -> str | None:
     """Rebuild a public docs URL from a context-chunk `title`.
@@ -122,24 +146,23 @@ async def ask_genius(query: str, path: str = DEFAULT_PATH) -> dict:
         cur_event = None
         data_buf = []
 
-    async with httpx.AsyncClient(timeout=_TIMEOUT, follow_redirects=True) as client:
-        async with client.stream("GET", url, headers=_HEADERS) as resp:
-            resp.raise_for_status()
-            async for line in resp.aiter_lines():
-                if line == "":  # blank line terminates the current event
-                    ending = cur_event == "e"
-                    dispatch()
-                    if ending:
-                        break
-                    continue
-                if line.startswith("event:"):
-                    cur_event = line[len("event:"):].strip()
-                elif line.startswith("data:"):
-                    value = line[len("data:"):]
-                    if value.startswith(" "):  # SSE: strip one optional leading space
-                        value = value[1:]
-                    data_buf.append(value)
-            dispatch()  # flush a trailing event with no terminating blank line
+    async with _get_client().stream("GET", url, headers=_HEADERS) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if line == "":  # blank line terminates the current event
+                ending = cur_event == "e"
+                dispatch()
+                if ending:
+                    break
+                continue
+            if line.startswith("event:"):
+                cur_event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                value = line[len("data:"):]
+                if value.startswith(" "):  # SSE: strip one optional leading space
+                    value = value[1:]
+                data_buf.append(value)
+        dispatch()  # flush a trailing event with no terminating blank line
 
     return {
         "answer": _clean_answer("".join(answer_parts)),
@@ -32,6 +32,9 @@ Tools (call them in this order):
   - doc_fetch_tool(url)       Fetch any allowed Juspay docs URL. Returns
                               markdown. Use this after explore_product to
                               read specific pages.
+  - doc_fetch_batch_tool(urls) Same as doc_fetch_tool for up to 20 URLs,
+                              fetched concurrently. Prefer it when you
+                              already know several pages to read.
   - juspay_genius_docs(query) Ask "Genius", the AI assistant behind the Juspay
                               docs, a natural-language question; returns a
                               synthesized answer plus the source doc URLs used.
@@ -4,18 +4,23 @@
 # you may not use this file except in compliance with the License.
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
-"""Juspay Docs MCP - server with three tools backed by dynamic discovery.
+"""Juspay Docs MCP - server with four tools backed by dynamic discovery.
 
 Tools:
-  - list_products(category?)  Browse the discovered product catalog.
-  - explore_product(product)  Fetch one product's llms.txt by slug.
-  - doc_fetch_tool(url)       Fetch any allowed Juspay docs URL as markdown.
+  - list_products(category?)    Browse the discovered product catalog.
+  - explore_product(product)    Fetch one product's llms.txt by slug.
+  - doc_fetch_tool(url)         Fetch any allowed Juspay docs URL as markdown.
+  - doc_fetch_batch_tool(urls)  Fetch several allowed URLs concurrently.
 
 Discovery runs once at module import; results are persisted to snapshot.json.
 """
 
+import asyncio
 import logging
+import os
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Annotated, Any, Literal, Optional
 from urllib.parse import urlparse
 
@@ -25,7 +30,7 @@ from pydantic import Field
 
 from juspay_mcp.analytics import record_stage_status, record_tool_call
 from juspay_docs_mcp.discovery import load_snapshot_sources, refresh_and_save
-from juspay_docs_mcp.genius import ask_genius
+from juspay_docs_mcp.genius import ask_genius, close_http_client as close_genius_client
 from juspay_docs_mcp.instructions import INSTRUCTIONS
 
 logger = logging.getLogger(__name__)
@@ -39,8 +44,11 @@ _ALLOWED_SUFFIXES = (".juspay.io", ".juspay.in")
 _ALLOWED_EXACT = frozenset({"juspay.io", "juspay.in", "dth95m2xtyv8v.cloudfront.net"})
 _ALLOWED_SCHEMES = frozenset({"http", "https"})
 _ALLOWED_DOMAINS_DISPLAY = "*.juspay.io, *.juspay.in, dth95m2xtyv8v.cloudfront.net"
+_NOT_ALLOWED = f"Error: URL not on an allowed domain. Allowed: {_ALLOWED_DOMAINS_DISPLAY}"
 
 
+# Agents re-read the same handful of pages, so parsed verdicts are memoized.
+@lru_cache(maxsize=1024)
 def _url_allowed(url: str) -> bool:
     parsed = urlparse(url)
     if parsed.scheme not in _ALLOWED_SCHEMES:
@@ -49,7 +57,7 @@ def _url_allowed(url: str) -> bool:
     host = parsed.hostname or ""
     if host in _ALLOWED_EXACT:
         return True
-    return any(host.endswith(s) for s in _ALLOWED_SUFFIXES)
+    return host.endswith(_ALLOWED_SUFFIXES)
 
 
 # ----------------------------------------------------------------------------
@@ -74,15 +82,38 @@ def _slug_for(entry: dict) -> Optional[str]:
     return None
 
 
+def _format_product(entry: dict) -> str:
+    """Render one catalog entry as its list_products block."""
+    slug = _slug_for(entry) or "-"
+    cat = entry.get("category") or "-"
+    title = entry.get("title") or entry["name"].split("\n", 1)[0].replace("Name: ", "")
+    lines = [
+        f"Slug: {slug}",
+        f"Title: {title}",
+        f"Category: {cat}",
+        f"URL: {entry['llms_txt']}",
+    ]
+    desc = entry.get("description")
+    if desc:
+        lines.append(f"Description: {desc}")
+    lines.append("")
+    return "\n".join(lines)
+
+
 _SLUG_INDEX: dict[str, dict] = {}
-_DOMAINS: set[str] = set()
+_DOMAINS: frozenset[str] = frozenset()
 _CATEGORIES: list[str] = []
 _CAT_HINT: str = "(none discovered)"
+# list_products blocks, parallel to _ENRICHED_SOURCES; the catalog only changes
+# on refresh, so they are rendered here rather than on every call.
+_PRODUCT_BLOCKS: list[str] = []
+# Lowercased category -> its blocks, so a category filter is one dict lookup.
+_CATEGORY_BLOCKS: dict[str, list[str]] = {}
 
 
 def _rebuild_indexes() -> None:
     """Recompute the lookup structures derived from _ENRICHED_SOURCES."""
-    global _SLUG_INDEX, _DOMAINS, _CATEGORIES, _CAT_HINT
+    global _SLUG_INDEX, _DOMAINS, _CATEGORIES, _CAT_HINT, _PRODUCT_BLOCKS, _CATEGORY_BLOCKS
 
     slug_index: dict[str, dict] = {}
     domains: set[str] = set()
@@ -98,10 +129,18 @@ def _rebuild_indexes() -> None:
         s["category"] for s in _ENRICHED_SOURCES if s.get("category")
     })
 
+    blocks = [_format_product(entry) for entry in _ENRICHED_SOURCES]
+    category_blocks: dict[str, list[str]] = {}
+    for entry, block in zip(_ENRICHED_SOURCES, blocks):
+        if entry.get("category"):
+            category_blocks.setdefault(entry["category"].lower(), []).append(block)
+
     _SLUG_INDEX = slug_index
-    _DOMAINS = domains
+    _DOMAINS = frozenset(domains)
     _CATEGORIES = categories
     _CAT_HINT = ", ".join(categories) if categories else "(none discovered)"
+    _PRODUCT_BLOCKS = blocks
+    _CATEGORY_BLOCKS = category_blocks
 
 
 _rebuild_indexes()
@@ -142,13 +181,26 @@ logger.info(
 # HTTP client (shared across tools)
 # ----------------------------------------------------------------------------
 
+# Explicit pool limits keep connections to the docs hosts alive between tool
+# calls, so an agent reading several pages back to back reuses one TLS session.
 _HTTPX = httpx.AsyncClient(
     follow_redirects=True,
     timeout=30.0,
     headers={"User-Agent": "juspay-docs-mcp"},
+    limits=httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=30.0,
+    ),
 )
 
 
+async def close_http_client() -> None:
+    """Close the shared docs clients (called from main.py's lifespan)."""
+    await _HTTPX.aclose()
+    await close_genius_client()
+
+
 # ----------------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------------
@@ -156,15 +208,139 @@ _HTTPX = httpx.AsyncClient(
 
 
 
+# Docs pages and llms.txt indexes change rarely, so fetched text is kept per
+# URL. Within _FETCH_TTL a repeat fetch is answered from memory; after that the
+# entry is revalidated with If-None-Match / If-Modified-Since and a 304 reuses
+# the cached text. Error responses are never cached.
+_FETCH_TTL = float(os.getenv("JUSPAY_DOCS_FETCH_TTL", "600"))
+_FETCH_CACHE_MAX = 512
+# Total cached text, in characters (≈ bytes for these mostly-ASCII docs). The
+# cache is shared by every session, so it is bounded by size as well as count;
+# a single body larger than the whole budget is returned but not cached.
+_FETCH_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+# url -> (fresh_until, etag, last_modified, text), least recently used first.
+_FETCH_CACHE: OrderedDict[str, tuple[float, Optional[str], Optional[str], str]] = OrderedDict()
+_fetch_cache_chars = 0
+
+
+def _cache_put(url: str, entry: tuple[float, Optional[str], Optional[str], str]) -> None:
+    """Store `entry`, evicting least recently used URLs to stay within budget."""
+    global _fetch_cache_chars
+    old = _FETCH_CACHE.pop(url, None)
+    if old is not None:
+        _fetch_cache_chars -= len(old[3])
+    if len(entry[3]) > _FETCH_CACHE_MAX_CHARS:
+        return
+    _FETCH_CACHE[url] = entry
+    _fetch_cache_chars += len(entry[3])
+    while len(_FETCH_CACHE) > _FETCH_CACHE_MAX or _fetch_cache_chars > _FETCH_CACHE_MAX_CHARS:
+        _, evicted = _FETCH_CACHE.popitem(last=False)
+        _fetch_cache_chars -= len(evicted[3])
+
+# Bodies are streamed and abandoned past this size, and obviously binary
+# content types are refused before any of the body is read, so one bad URL
+# can't pin memory or CPU for the other sessions.
+_FETCH_MAX_BYTES = int(os.getenv("JUSPAY_DOCS_MAX_BYTES", str(8 * 1024 * 1024)))
+_BINARY_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+)
+
+
+def _refusal(response: httpx.Response) -> Optional[str]:
+    """Why a response should not be read, judged from its headers alone."""
+    content_type = response.headers.get("content-type", "").lower()
+    if content_type.startswith(_BINARY_CONTENT_TYPES):
+        return f"Error: {response.url} is not a text document ({content_type})."
+    length = response.headers.get("content-length")
+    if length and length.isdigit() and int(length) > _FETCH_MAX_BYTES:
+        return f"Error: {response.url} is larger than {_FETCH_MAX_BYTES} bytes."
+    return None
+
+
+# url -> the download currently running for it. Concurrent fetches of one URL
+# (e.g. an agent branching) share a single request.
+_FETCH_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
 async def _fetch(url: str) -> str:
     """Fetch URL and return the raw response text."""
+    cached = _FETCH_CACHE.get(url)
+    if cached is not None and time.monotonic() < cached[0]:
+        _FETCH_CACHE.move_to_end(url)
+        return cached[3]
+
+    task = _FETCH_INFLIGHT.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_download(url, cached))
+        _FETCH_INFLIGHT[url] = task
+        task.add_done_callback(lambda t: _finish_download(url, t))
+    # Shielded so one cancelled caller doesn't cancel the download for the rest.
+    return await asyncio.shield(task)
+
+
+def _finish_download(url: str, task: asyncio.Task) -> None:
+    if _FETCH_INFLIGHT.get(url) is task:
+        del _FETCH_INFLIGHT[url]
+    if not task.cancelled():
+        # Mark the exception retrieved even if every waiter was cancelled.
+        task.exception()
+
+
+async def _download(url: str, cached: Optional[tuple]) -> str:
+    """GET url (conditionally, when `cached` has validators) and cache the text."""
+    headers = {}
+    if cached is not None:
+        if cached[1]:
+            headers["If-None-Match"] = cached[1]
+        if cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+
     try:
-        response = await _HTTPX.get(url)
-        response.raise_for_status()
-        return response.text
+        async with _HTTPX.stream("GET", url, headers=headers) as response:
+            # httpx follows redirects itself; every hop must stay on the
+            # allowlist, or an off-domain body would be cached under `url`.
+            if not all(_url_allowed(str(hop.url)) for hop in (*response.history, response)):
+                return _NOT_ALLOWED
+            if response.status_code == 304 and cached is not None:
+                text = cached[3]
+            else:
+                response.raise_for_status()
+                refusal = _refusal(response)
+                if refusal:
+                    return refusal
+                chunks: list[bytes] = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > _FETCH_MAX_BYTES:
+                        return f"Error: {response.url} is larger than {_FETCH_MAX_BYTES} bytes."
+                    chunks.append(chunk)
+                text = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
     except (httpx.HTTPStatusError, httpx.RequestError) as e:
         return f"Encountered an HTTP error: {e}"
 
+    _cache_put(url, (
+        time.monotonic() + _FETCH_TTL,
+        response.headers.get("etag") or (cached[1] if cached else None),
+        response.headers.get("last-modified") or (cached[2] if cached else None),
+        text,
+    ))
+    return text
+
+
+async def _fetch_allowed(url: str) -> str:
+    """_fetch, after checking the URL against the domain allowlist."""
+    if not _url_allowed(url):
+        return _NOT_ALLOWED
+    return await _fetch(url)
+
 
 # ----------------------------------------------------------------------------
 # MCP server + tools
@@ -314,18 +490,14 @@ async def juspay_genius_docs(
 
 def _list_products(category: Optional[str] = None) -> str:
     if category:
-        cat_lower = category.lower()
-        matched = [
-            s for s in _ENRICHED_SOURCES
-            if (s.get("category") or "").lower() == cat_lower
-        ]
+        matched = _CATEGORY_BLOCKS.get(category.lower())
         if not matched:
             return (
                 f"No products match category {category!r}. "
                 f"Available categories: {_CAT_HINT}."
             )
     else:
-        matched = _ENRICHED_SOURCES
+        matched = _PRODUCT_BLOCKS
 
     if not matched:
         return (
@@ -334,23 +506,8 @@ def _list_products(category: Optional[str] = None) -> str:
             "Check server logs."
         )
 
-    lines = [
-        f"Available products ({len(matched)} of {len(_ENRICHED_SOURCES)}):",
-        "",
-    ]
-    for s in matched:
-        slug = _slug_for(s) or "-"
-        cat = s.get("category") or "-"
-        title = s.get("title") or s["name"].split("\n", 1)[0].replace("Name: ", "")
-        lines.append(f"Slug: {slug}")
-        lines.append(f"Title: {title}")
-        lines.append(f"Category: {cat}")
-        lines.append(f"URL: {s['llms_txt']}")
-        desc = s.get("description")
-        if desc:
-            lines.append(f"Description: {desc}")
-        lines.append("")
-    return "\n".join(lines)
+    header = f"Available products ({len(matched)} of {len(_ENRICHED_SOURCES)}):"
+    return header + "\n\n" + "\n".join(matched)
 
 
 @mcp.tool()
@@ -468,12 +625,7 @@ async def doc_fetch_tool(
     error = None
     try:
         url = url.strip()
-        if not _url_allowed(url):
-            return (
-                f"Error: URL not on an allowed domain. "
-                f"Allowed: {_ALLOWED_DOMAINS_DISPLAY}"
-            )
-        return await _fetch(url)
+        return await _fetch_allowed(url)
     except Exception as e:
         status = "error"
         error = str(e)
@@ -488,5 +640,64 @@ async def doc_fetch_tool(
         )
 
 
+_FETCH_BATCH_MAX = 20
+# Bounds how many pages one doc_fetch_batch_tool call downloads at once.
+_FETCH_BATCH_CONCURRENCY = 8
+
+
+@mcp.tool()
+async def doc_fetch_batch_tool(
+    urls: Annotated[
+        list[str],
+        Field(
+            description=(
+                f"Up to {_FETCH_BATCH_MAX} URLs to fetch. Each must be on an "
+                f"allowed domain: {_ALLOWED_DOMAINS_DISPLAY}."
+            ),
+            min_length=1,
+            max_length=_FETCH_BATCH_MAX,
+        ),
+    ],
+) -> str:
+    """Fetch several allowed Juspay docs URLs in one call.
+
+    Same as doc_fetch_tool(url) for each URL, but the pages are downloaded
+    concurrently. Returns each page under a "## <url>" heading, in the order
+    given; a URL that fails or is disallowed gets its error text instead.
+    """
+    started_at = time.perf_counter()
+    status = "success"
+    error = None
+    urls = [u.strip() for u in urls]
+    try:
+        semaphore = asyncio.Semaphore(_FETCH_BATCH_CONCURRENCY)
+
+        async def fetch_one(url: str) -> str:
+            # One malformed URL becomes its own Error section rather than
+            # aborting the gather and losing every other page.
+            try:
+                async with semaphore:
+                    return await _fetch_allowed(url)
+            except Exception as e:
+                logger.warning("doc_fetch_batch_tool failed for %s: %s", url, e)
+                return f"Error: could not fetch {url}: {e}"
+
+        unique = list(dict.fromkeys(urls))
+        by_url = dict(zip(unique, await asyncio.gather(*map(fetch_one, unique))))
+        return "\n\n".join(f"## {u}\n\n{by_url[u]}" for u in urls)
+    except Exception as e:
+        status = "error"
+        error = str(e)
+        raise
+    finally:
+        await _safe_record_tool_call(
+            tool="doc_fetch_batch_tool",
+            status=status,
+            started_at=started_at,
+            arguments={"urls": urls},
+            error=error,
+        )
+
+
 # Export the underlying low-level Server for main.py / stdio.py
 app = mcp._mcp_server
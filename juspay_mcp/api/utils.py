@@ -5,6 +5,7 @@
 # You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
 
 import httpx
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from juspay_mcp.config import get_json_headers
 import logging 
 from contextvars import ContextVar
@@ -22,6 +23,31 @@ def get_juspay_credentials() -> dict | None:
     """Get Juspay credentials from the current context."""
     return juspay_credentials.get()
 
+# Shared, lazily created client so consecutive Juspay API calls reuse pooled
+# keep-alive connections rather than opening a new one per request.
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared Juspay API client, creating it on first use.
+
+    The client serves every merchant, so its cookie jar accepts no cookies:
+    a Set-Cookie from one merchant's response must never reach another's request.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared client (called from main.py's lifespan)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 async def call(api_url: str, customer_id: str | None = None, additional_headers: dict = None) -> dict:
     # Get Juspay credentials from context
     juspay_creds = get_juspay_credentials()
@@ -30,25 +56,25 @@ async def call(api_url: str, customer_id: str | None = None, additional_headers:
     if additional_headers:
         headers.update(additional_headers)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            safe_headers = ["x-request-id"]
-            logger.info(
-                f"Calling Juspay API at: {api_url} with permitted headers: {safe_headers if safe_headers else 'None'}"
-            )
-            response = await client.get(api_url, headers=headers)
-            logger.info(f"Response: {response}")
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"Get API Response Data: {response_data}")
-            return response_data
-        except httpx.HTTPStatusError as e:
-            error_content = e.response.text if e.response else "Unknown error"
-            logger.error(f"HTTP error: {e.response.status_code if e.response else 'No response'} - {error_content}")
-            raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
-        except Exception as e:
-            logger.error(f"Error during Juspay API call: {e}")
-            raise Exception(f"Failed to call Juspay API: {e}") from e
+    client = get_http_client()
+    try:
+        safe_headers = ["x-request-id"]
+        logger.info(
+            f"Calling Juspay API at: {api_url} with permitted headers: {safe_headers if safe_headers else 'None'}"
+        )
+        response = await client.get(api_url, headers=headers)
+        logger.info("Response: %s", response)
+        response.raise_for_status()
+        response_data = response.json()
+        logger.info("Get API Response Data: %s", response_data)
+        return response_data
+    except httpx.HTTPStatusError as e:
+        error_content = e.response.text if e.response else "Unknown error"
+        logger.error("HTTP error: %s - %s", e.response.status_code if e.response else 'No response', error_content)
+        raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
+    except Exception as e:
+        logger.error("Error during Juspay API call: %s", e)
+        raise Exception(f"Failed to call Juspay API: {e}") from e
 
 async def post(api_url: str, payload: dict, routing_id: str | None = None) -> dict:
     effective_routing_id = routing_id or payload.get("customer_id")
@@ -56,18 +82,18 @@ async def post(api_url: str, payload: dict, routing_id: str | None = None) -> di
     juspay_creds = get_juspay_credentials()
     headers = get_json_headers(routing_id=effective_routing_id, juspay_creds=juspay_creds) 
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.info(f"Calling Juspay API at: {api_url} with body: {payload}")
-            response = await client.post(api_url, headers=headers, json=payload)
-            response.raise_for_status()
-            response_data = response.json()
-            logger.info(f"API Response Data: {response_data}")
-            return response_data
-        except httpx.HTTPStatusError as e:
-            error_content = e.response.text if e.response else "Unknown error"
-            logger.error(f"HTTP error: {e.response.status_code if e.response else 'No response'} - {error_content}")
-            raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
-        except Exception as e:
-            logger.error(f"Error during Juspay API call: {e}")
-            raise Exception(f"Failed to call Juspay API: {e}") from e
+    client = get_http_client()
+    try:
+        logger.info("Calling Juspay API at: %s with body: %s", api_url, payload)
+        response = await client.post(api_url, headers=headers, json=payload)
+        response.raise_for_status()
+        response_data = response.json()
+        logger.info("API Response Data: %s", response_data)
+        return response_data
+    except httpx.HTTPStatusError as e:
+        error_content = e.response.text if e.response else "Unknown error"
+        logger.error("HTTP error: %s - %s", e.response.status_code if e.response else 'No response', error_content)
+        raise Exception(f"Juspay API HTTPError ({e.response.status_code if e.response else 'Unknown status'}): {error_content}") from e
+    except Exception as e:
+        logger.error("Error during Juspay API call: %s", e)
+        raise Exception(f"Failed to call Juspay API: {e}") from e
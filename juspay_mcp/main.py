@@ -47,8 +47,10 @@ MCP_APPS = {}
 
 if JUSPAY_MCP_TYPE == "DASHBOARD":
     from juspay_dashboard_mcp.tools import app as dashboard_app
+    from juspay_dashboard_mcp.api.utils import close_http_client as close_dashboard_http_client
     from juspay_docs_mcp.server import (
         app as docs_app,
+        close_http_client as close_docs_http_client,
         refresh_catalog,
     )
 
@@ -58,6 +60,7 @@ elif JUSPAY_MCP_TYPE in AI_STUDIO_MCP_TYPES:
     from juspay_ai_studio_mcp.tools import app as ai_studio_app
     from juspay_docs_mcp.server import (
         app as docs_app,
+        close_http_client as close_docs_http_client,
         refresh_catalog,
     )
 
@@ -66,6 +69,7 @@ elif JUSPAY_MCP_TYPE in AI_STUDIO_MCP_TYPES:
 else:
     # Single default FastMCP app
     from juspay_mcp.tools import app as default_app
+    from juspay_mcp.api.utils import close_http_client as close_juspay_http_client
 
     MCP_APPS["default"] = default_app
 
@@ -418,6 +422,8 @@ def main(host: str, port: int, mode: str):
                     docs_refresh.cancel()
                     with contextlib.suppress(asyncio.CancelledError):
                         await docs_refresh
+                await close_dashboard_http_client()
+                await close_docs_http_client()
                 await shutdown_analytics()
             logger.info("StreamableHTTP session managers stopped")
     elif JUSPAY_MCP_TYPE in AI_STUDIO_MCP_TYPES:
@@ -465,6 +471,7 @@ def main(host: str, port: int, mode: str):
                     docs_refresh.cancel()
                     with contextlib.suppress(asyncio.CancelledError):
                         await docs_refresh
+                await close_docs_http_client()
             logger.info("StreamableHTTP session managers stopped")
 
     else:
@@ -497,6 +504,7 @@ def main(host: str, port: int, mode: str):
                         await oauth_state_store.stop()
                     if portal_client is not None:
                         await portal_client.aclose()
+                    await close_juspay_http_client()
             logger.info("StreamableHTTP session manager stopped")
 
     # Authentication middleware — OAuth bearer when enabled, else legacy header path.
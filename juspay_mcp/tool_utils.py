@@ -0,0 +1,73 @@
+# Copyright 2025 Juspay
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0.txt
+
+"""Tool dispatch helpers shared by the PG, dashboard and AI Studio servers."""
+
+import importlib
+import inspect
+from functools import lru_cache
+
+from pydantic import ValidationError
+
+
+@lru_cache(maxsize=None)
+def tool_schema(model):
+    """JSON schema for a tool's payload model, generated once on first request."""
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def required_fields(model):
+    """Required top-level fields of a tool's payload model."""
+    return frozenset(tool_schema(model).get("required", ()))
+
+
+@lru_cache(maxsize=None)
+def resolve_handler(path, package):
+    """Import a handler given as "<module>.<function>" under `package`.
+
+    e.g. resolve_handler("session.session_api_juspay", "juspay_mcp.api").
+    Handler modules are only imported when one of their tools is first called,
+    so startup doesn't pay for every API module. Returns the handler bound to
+    its call shape by make_invoker, computed once here rather than on every
+    tool call.
+    """
+    module_name, _, attr = path.rpartition(".")
+    handler = getattr(importlib.import_module(f"{package}.{module_name}"), attr)
+    return make_invoker(handler, len(inspect.signature(handler).parameters))
+
+
+def make_invoker(handler, param_count):
+    """Bind `handler` to an async callable taking (payload, meta_info).
+
+    The call shape is chosen once from the handler's arity, so tool dispatch
+    doesn't branch on it for every call.
+    """
+    if param_count == 0:
+        async def invoke(payload, meta_info):
+            return await handler()
+    elif param_count == 1:
+        async def invoke(payload, meta_info):
+            return await handler(payload if payload or not meta_info else meta_info)
+    elif param_count == 2:
+        invoke = handler
+    else:
+        raise ValueError(f"Unsupported number of parameters in tool handler: {param_count}")
+    return invoke
+
+
+def validation_message(exc):
+    """Compact "<field>: <message>; ..." text for a payload validation failure.
+
+    Pydantic's str(ValidationError) spans several lines per error, with input
+    reprs and documentation URLs; tool errors only need the field and reason.
+    """
+    if not isinstance(exc, ValidationError):
+        return str(exc)
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc'])) or exc.title}: {err['msg']}"
+        for err in exc.errors(include_url=False, include_input=False)
+    )
@@ -6,15 +6,13 @@
 
 import json
 import mcp.types as types
-import inspect
 import logging
 from mcp.server.lowlevel import Server
-from mcp.server.sse import SseServerTransport
 
 from juspay_mcp import response_schema
-from juspay_mcp.api import *
 import juspay_mcp.api_schema as api_schema
 import juspay_mcp.utils as util
+from juspay_mcp import tool_utils
 
 logger = logging.getLogger(__name__)
 app = Server("juspay")
@@ -30,12 +28,15 @@ def get_juspay_request_credentials():
     """Get Juspay credentials from current request context."""
     return juspay_request_credentials.get()
 
+# Shared compact encoder for tool responses; non-JSON values raise as with json.dumps.
+_encode_response = json.JSONEncoder(separators=(",", ":")).encode
+
 AVAILABLE_TOOLS = [
     util.make_api_config(
         name="session_api_juspay",
         description="Creates a new Juspay session for a given order.",
         model=api_schema.session.JuspaySessionPayload,
-        handler=session.session_api_juspay,
+        handler="session.session_api_juspay",
         response_schema=response_schema.session_response_schema,
     ),
     util.make_api_config(
@@ -52,14 +53,14 @@ Key features:
 
 Use this tool to check the current status of an order, verify payment completion before order fulfillment, retrieve transaction details for reconciliation, or fetch comprehensive order information for customer support inquiries. Essential for validating amount and status before fulfilling orders.""",
         model=api_schema.order.JuspayOrderStatusPayload,
-        handler=order.order_status_api_juspay,
+        handler="order.order_status_api_juspay",
         response_schema=response_schema.order_status_response_schema,
     ),
     util.make_api_config(
         name="create_refund_juspay",
         description="Initiates a refund for a specific Juspay order using its `order_id`.",
         model=api_schema.refund.JuspayRefundPayload,
-        handler=refund.create_refund_juspay,
+        handler="refund.create_refund_juspay",
         response_schema=response_schema.refund_creation_response_schema,
     ),
     util.make_api_config(
@@ -74,56 +75,56 @@ Key features:
 
 Use this tool to retrieve customer profile information, verify customer details, fetch customer data for order processing, or obtain customer information for support inquiries. Essential for customer management and authentication workflows.""",
         model=api_schema.customer.JuspayGetCustomerPayload,
-        handler=customer.get_customer_juspay,
+        handler="customer.get_customer_juspay",
         response_schema=response_schema.get_customer_response_schema,
     ),
     util.make_api_config(
         name="create_customer_juspay",
         description="Creates a new customer in Juspay with the provided details.",
         model=api_schema.customer.JuspayCreateCustomerPayload,
-        handler=customer.create_customer_juspay,
+        handler="customer.create_customer_juspay",
         response_schema=response_schema.create_customer_response_schema,
     ),
     util.make_api_config(
         name="update_customer_juspay",
         description="Updates an existing customer in Juspay with the provided details.",
         model=api_schema.customer.JuspayUpdateCustomerPayload,
-        handler=customer.update_customer_juspay,
+        handler="customer.update_customer_juspay",
         response_schema=response_schema.update_customer_response_schema,
     ),
     util.make_api_config(
         name="order_fulfillment_sync_juspay",
         description="Updates the fulfillment status of a Juspay order.",
         model=api_schema.order.JuspayOrderFulfillmentPayload,
-        handler=order.order_fulfillment_sync,
+        handler="order.order_fulfillment_sync",
         response_schema=response_schema.order_fulfillment_response_schema,
     ),
     util.make_api_config(
         name="create_txn_refund_juspay",
         description="Initiates a refund based on transaction ID (instead of order ID).",
         model=api_schema.refund.JuspayTxnRefundPayload,
-        handler=refund.create_txn_refund_juspay,
+        handler="refund.create_txn_refund_juspay",
         response_schema=response_schema.txn_refund_response_schema,
     ),
     util.make_api_config(
         name="create_txn_juspay",
         description="Creates an order and processes payment in a single API call.",
         model=api_schema.txn.JuspayCreateTxnPayload,
-        handler=txn.create_txn_juspay,
+        handler="txn.create_txn_juspay",
         response_schema=response_schema.create_txn_response_schema,
     ),
     util.make_api_config(
         name="create_moto_txn_juspay",
         description="Creates an order with MOTO (Mail Order/Telephone Order) authentication.",
         model=api_schema.txn.JuspayCreateMotoTxnPayload,
-        handler=txn.create_moto_txn_juspay,
+        handler="txn.create_moto_txn_juspay",
         response_schema=response_schema.create_moto_txn_response_schema,
     ),
     util.make_api_config(
         name="add_card_juspay",
         description="Adds a new card to the Juspay system for a customer.",
         model=api_schema.card.JuspayAddCardPayload,
-        handler=card.add_card_juspay,
+        handler="card.add_card_juspay",
         response_schema=response_schema.add_card_response_schema,
     ),
     util.make_api_config(
@@ -140,21 +141,21 @@ Key features:
 
 Use this tool to retrieve a customer's saved cards for payment processing, display saved payment methods in checkout flows, verify card tokenization status, or check card eligibility for specific payment features like CVV-less transactions or mandates. Essential for implementing saved card functionality and one-click payments.""",
         model=api_schema.card.JuspayListCardsPayload,
-        handler=card.list_cards_juspay,
+        handler="card.list_cards_juspay",
         response_schema=response_schema.list_cards_response_schema,
     ),
     util.make_api_config(
         name="delete_card_juspay",
         description="Deletes a saved card from the Juspay system.",
         model=api_schema.card.JuspayDeleteCardPayload,
-        handler=card.delete_card_juspay,
+        handler="card.delete_card_juspay",
         response_schema=response_schema.delete_card_response_schema,
     ),
     util.make_api_config(
         name="update_card_juspay",
         description="Updates details for a saved card.",
         model=api_schema.card.JuspayUpdateCardPayload,
-        handler=card.update_card_juspay,
+        handler="card.update_card_juspay",
         response_schema=response_schema.update_card_response_schema,
     ),
     util.make_api_config(
@@ -168,7 +169,7 @@ Key features:
 
 Use this tool to retrieve card information before processing payments, validate card eligibility for specific payment features, determine card issuer and type, or check support for advanced payment methods like mandates and tokenization. Essential for payment method validation and feature enablement.""",
         model=api_schema.card.JuspayCardInfoPayload,
-        handler=card.get_card_info_juspay,
+        handler="card.get_card_info_juspay",
         response_schema=response_schema.card_info_response_schema,
     ),
     util.make_api_config(
@@ -182,7 +183,7 @@ Key features:
 
 Use this tool to retrieve BINs that support specific authentication methods, validate card eligibility for OTP or VIES authentication, or filter payment options based on supported authentication types. Essential for implementing authentication-specific payment flows.""",
         model=api_schema.card.JuspayBinListPayload,
-        handler=card.get_bin_list_juspay,
+        handler="card.get_bin_list_juspay",
         response_schema=response_schema.bin_list_response_schema,
     ),
     util.make_api_config(
@@ -199,28 +200,28 @@ Key features:
 
 Use this tool to display saved payment options during checkout, enable one-click payments, retrieve customer's preferred payment methods, or create a personalized checkout experience. Essential for implementing express checkout and improving payment conversion rates.""",
         model=api_schema.upi.JuspaySavedPaymentMethodsPayload,
-        handler=upi.get_saved_payment_methods,
+        handler="upi.get_saved_payment_methods",
         response_schema=response_schema.saved_payment_methods_response_schema,
     ),
     util.make_api_config(
         name="upi_collect",
         description="Creates a UPI Collect transaction for requesting payment from a customer's UPI ID.",
         model=api_schema.upi.JuspayUpiCollectPayload,
-        handler=upi.upi_collect,
+        handler="upi.upi_collect",
         response_schema=response_schema.upi_collect_response_schema,
     ),
     util.make_api_config(
         name="verify_vpa",
         description="Verifies if a UPI Virtual Payment Address (VPA) is valid.",
         model=api_schema.upi.JuspayVerifyVpaPayload,
-        handler=upi.verify_vpa,
+        handler="upi.verify_vpa",
         response_schema=response_schema.verify_vpa_response_schema,
     ),
     util.make_api_config(
         name="upi_intent",
         description="Creates a UPI Intent transaction for payment using UPI apps.",
         model=api_schema.upi.JuspayUpiIntentPayload,
-        handler=upi.upi_intent,
+        handler="upi.upi_intent",
         response_schema=response_schema.upi_intent_response_schema,
     ),
     util.make_api_config(
@@ -239,7 +240,7 @@ Key features:
 
 Use this tool to display available offers during checkout, validate coupon codes, calculate discount amounts, show offer eligibility based on payment methods, or provide personalized offer recommendations. Essential for implementing promotional campaigns and improving conversion rates.""",
         model=api_schema.offer.JuspayListOffersPayload,
-        handler=offer.list_offers_juspay,
+        handler="offer.list_offers_juspay",
         response_schema=response_schema.list_offers_response_schema,
     ),
     util.make_api_config(
@@ -257,66 +258,75 @@ Key features:
 
 Use this tool to display available wallet payment options, check wallet balances before payment, retrieve linked wallet information for one-click payments, or show wallet payment methods during checkout. Essential for implementing wallet-based payments and managing customer wallet preferences.""",
         model=api_schema.wallet.ListWalletsPayload,
-        handler=wallet.list_wallets,
+        handler="wallet.list_wallets",
         response_schema=response_schema.list_wallets_response_schema,
     ),
     util.make_api_config(
         name="create_order_juspay",
         description="Creates a new order in Juspay payment system.",
         model=api_schema.order.JuspayCreateOrderPayload,
-        handler=order.create_order_juspay,
+        handler="order.create_order_juspay",
         response_schema=response_schema.create_order_response_schema,
     ),
     util.make_api_config(
         name="update_order_juspay",
         description="Updates an existing order in Juspay.",
         model=api_schema.order.JuspayUpdateOrderPayload,
-        handler=order.update_order_juspay,
+        handler="order.update_order_juspay",
         response_schema=response_schema.update_order_response_schema,
     ),
 ]
 
+TOOLS_BY_NAME = {tool.name: tool for tool in AVAILABLE_TOOLS}
+
+# AVAILABLE_TOOLS is fixed at import, so the tool list is built on the first
+# list_tools request and reused afterwards.
+_LIST_TOOLS_CACHE: list[types.Tool] | None = None
+
 @app.list_tools()
 async def list_my_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name=tool["name"],
-            description=tool["description"],
-            inputSchema=tool["schema"],
-        )
-        for tool in AVAILABLE_TOOLS
-    ]
+    global _LIST_TOOLS_CACHE
+    if _LIST_TOOLS_CACHE is None:
+        _LIST_TOOLS_CACHE = [
+            types.Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema=tool_utils.tool_schema(tool.model),
+            )
+            for tool in AVAILABLE_TOOLS
+        ]
+    return _LIST_TOOLS_CACHE
 
 @app.call_tool()
 async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextContent]:
-    logger.info(f"Calling tool: {name} with args: {arguments}")
+    logger.info("Calling tool: %s with args: %s", name, arguments)
+    arguments = dict(arguments or {})
     try:
         # Import here to avoid circular imports
         from juspay_mcp.api.utils import set_juspay_credentials
         
-        tool_entry = next((t for t in AVAILABLE_TOOLS if t["name"] == name), None)
+        tool_entry = TOOLS_BY_NAME.get(name)
         if not tool_entry:
             raise ValueError(f"Unknown tool: {name}")
 
-        schema = tool_entry["schema"]
-        required = schema.get("required", [])
-        missing = [key for key in required if key not in arguments]
+        missing = tool_utils.required_fields(tool_entry.model) - arguments.keys()
         if missing:
-            raise ValueError(f"Missing required fields for {name}: {missing}")
+            raise ValueError(f"Missing required fields for {name}: {sorted(missing)}")
 
-        handler = tool_entry["handler"]
-        if not handler:
+        if not tool_entry.handler:
             raise ValueError(f"No handler defined for tool: {name}")
+        invoke = tool_utils.resolve_handler(tool_entry.handler, "juspay_mcp.api")
 
-        model_cls = tool_entry.get("model")
+        # Taken out before validation so models with extra="allow" don't pick it up.
+        meta_info = arguments.pop("juspay_meta_info", None)
+
+        # Handlers receive the raw arguments; the model is only used to validate them.
+        model_cls = tool_entry.model
         if model_cls:
             try:
-                payload = model_cls(**arguments)  
-                payload_dict = payload.dict(exclude_none=True) 
+                model_cls.model_validate(arguments)
             except Exception as e:
-                raise ValueError(f"Validation error: {str(e)}")
-        else:
-            payload_dict = arguments 
+                raise ValueError(f"Validation error: {tool_utils.validation_message(e)}")
         
         juspay_creds = get_juspay_request_credentials()
         if juspay_creds:
@@ -326,27 +336,9 @@ async def handle_tool_calls(name: str, arguments: dict) -> list[types.TextConten
             logger.info("No header credentials found, falling back to environment variables")
             set_juspay_credentials(None)
 
-        meta_info = arguments.pop("juspay_meta_info", None)
-
-        sig = inspect.signature(handler)
-        param_count = len(sig.parameters)
-
-        if param_count == 0:
-            response = await handler()
-
-        elif param_count == 1:
-            if arguments or not meta_info:
-                response = await handler(arguments)
-            else:
-                response = await handler(meta_info)
-
-        elif param_count == 2:
-            response = await handler(arguments, meta_info)
-
-        else:
-            raise ValueError(f"Unsupported number of parameters in tool handler: {param_count}")
-        return [types.TextContent(type="text", text=json.dumps(response))]
+        response = await invoke(arguments, meta_info)
+        return [types.TextContent(type="text", text=_encode_response(response))]
 
     except Exception as e:
-        logger.error(f"Error executing tool {name}: {e}")
+        logger.error("Error executing tool %s: %s", name, e)
         return [types.TextContent(type="text", text=f"ERROR: Tool execution failed: {str(e)}")]
@@ -6,16 +6,21 @@
 
 import json
 import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ToolConfig:
+    name: str
+    description: str
+    model: type
+    # "<module>.<function>" under juspay_mcp.api, resolved on first call.
+    handler: str
+
 
 def make_api_config(name, description, model, handler, response_schema=None):
     desc = description.strip()
     INCLUDE_RESPONSE_SCHEMA = os.getenv("INCLUDE_RESPONSE_SCHEMA")
     if INCLUDE_RESPONSE_SCHEMA == "true" and response_schema:
         desc += f"\nReturns response following this schema:\n{json.dumps(response_schema, indent=2)}"
-    return {
-        "name": name,
-        "description": desc,
-        "model": model,
-        "schema": model.model_json_schema(),
-        "handler": handler,
-    }
+    return ToolConfig(name, desc, model, handler)
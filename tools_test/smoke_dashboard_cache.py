@@ -0,0 +1,122 @@
+"""Verify the dashboard response cache is opt-in and never serves a cached
+response to a token Portal no longer accepts.
+
+With JUSPAY_DASHBOARD_RESPONSE_CACHE unset every call reaches the API. With it
+set, a repeat call is served from memory, but the token is re-validated with
+Portal first, so a revoked token gets an error instead of cached data. An
+expired entry is served stale only when the API is unavailable (5xx), never
+after a 4xx such as 401, and every stale response carries the "x-cache" marker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+os.environ["JUSPAY_DASHBOARD_RESPONSE_CACHE"] = "true"
+
+import httpx
+
+from juspay_dashboard_mcp import response_cache, tools
+from juspay_dashboard_mcp.api import utils as api_utils
+
+TOOL = "juspay_list_configured_gateway"
+state = {"token_status": 200, "gateway_status": 200, "gateway_body": {"gateways": [{"gateway": "PAYU"}]}}
+hits = {"validate": 0, "gateway": 0}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/validate/token"):
+        hits["validate"] += 1
+        if state["token_status"] != 200:
+            return httpx.Response(state["token_status"], json={"error": "token revoked"})
+        return httpx.Response(
+            200,
+            json={"validHost": "portal.juspay.in", "tenantAccountId": "t1", "context": "MERCHANT"},
+        )
+    hits["gateway"] += 1
+    if state["gateway_status"] != 200:
+        return httpx.Response(state["gateway_status"], json={"error": "upstream"})
+    return httpx.Response(200, json=state["gateway_body"])
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+    sys.exit(1)
+
+
+async def call(arguments: dict | None = None) -> str:
+    tools.set_juspay_request_credentials({"dashboard_token": "token-a"})
+    result = await tools.handle_tool_calls(TOOL, arguments or {})
+    return result[0].text
+
+
+async def main() -> None:
+    api_utils._http_client = None
+    api_utils.get_http_client()._transport = httpx.MockTransport(handler)
+
+    # Flag off: both calls reach the gateway API.
+    response_cache.JUSPAY_DASHBOARD_RESPONSE_CACHE = False
+    await call()
+    await call()
+    if hits["gateway"] != 2:
+        fail(f"cache disabled but gateway API called {hits['gateway']} times for 2 calls")
+    print("[OK] cache disabled -> every call reaches the API")
+
+    # Flag on: the repeat call is cached, but the token is checked each time.
+    response_cache.JUSPAY_DASHBOARD_RESPONSE_CACHE = True
+    response_cache.clear()
+    hits.update(validate=0, gateway=0)
+    first = await call()
+    validations_after_first = hits["validate"]
+    second = await call()
+    if hits["gateway"] != 1 or first != second:
+        fail(f"cache enabled but gateway API called {hits['gateway']} times for 2 calls")
+    if hits["validate"] != validations_after_first + 1:
+        fail("cache hit did not re-validate the token")
+    print("[OK] cache enabled -> repeat call served from memory after re-validation")
+
+    # Revoked token: the cached entry must not be served.
+    state["token_status"] = 401
+    text = await call()
+    if not text.startswith("ERROR") or "PAYU" in text:
+        fail(f"revoked token was served cached data: {text}")
+    print("[OK] revoked token -> error, not cached data")
+
+    def expire_entries() -> None:
+        for key, (_, stale_until, response) in list(response_cache._entries.items()):
+            response_cache._entries[key] = (0.0, stale_until, response)
+
+    # Upstream 5xx on an expired entry: the stale copy covers the outage.
+    state["token_status"] = 200
+    expire_entries()
+    state["gateway_status"] = 503
+    text = await call()
+    if "PAYU" not in text or '"x-cache":"stale"' not in text:
+        fail(f"5xx did not fall back to the stale copy: {text}")
+    print("[OK] upstream 5xx -> stale copy served")
+
+    # Upstream 401 on an expired entry: the error is returned, not stale data.
+    expire_entries()
+    state["gateway_status"] = 401
+    text = await call()
+    if not text.startswith("ERROR") or "PAYU" in text:
+        fail(f"401 was answered from the stale copy: {text}")
+    print("[OK] upstream 401 -> error, not stale copy")
+
+    # A non-dict response served stale is wrapped so it still carries the marker.
+    state.update(gateway_status=200, gateway_body=[{"gateway": "PAYU"}])
+    await call({"merchantId": "list-shaped"})
+    expire_entries()
+    state["gateway_status"] = 503
+    text = await call({"merchantId": "list-shaped"})
+    if '"x-cache":"stale"' not in text or '"response":[' not in text:
+        fail(f"stale list response was not labelled: {text}")
+    print("[OK] stale non-dict response -> wrapped with the stale marker")
+
+    await api_utils.close_http_client()
+
+
+asyncio.run(main())
+print("[OK] response cache honours the flag, token re-validation and stale rules")
@@ -0,0 +1,47 @@
+"""Verify the shared dashboard HTTP client never carries a cookie from one
+response into a later request. The client is shared by every user and tenant,
+so a Set-Cookie in user A's Portal response must not reach user B's call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import httpx
+
+from juspay_dashboard_mcp.api import utils as api_utils
+
+seen_cookies: list[str | None] = []
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    seen_cookies.append(request.headers.get("cookie"))
+    return httpx.Response(
+        200,
+        json={"ok": True},
+        headers={"set-cookie": "SESSION=userA; Path=/"},
+    )
+
+
+async def main() -> None:
+    api_utils._http_client = None
+    client = api_utils.get_http_client()
+    # Swap in a mock transport but keep the client's own cookie jar.
+    client._transport = httpx.MockTransport(handler)
+    try:
+        await client.get("https://portal.juspay.in/api/a", headers={"x-web-logintoken": "userA"})
+        await client.get("https://portal.juspay.in/api/b", headers={"x-web-logintoken": "userB"})
+    finally:
+        await api_utils.close_http_client()
+
+
+asyncio.run(main())
+
+if len(seen_cookies) != 2:
+    print(f"[FAIL] expected 2 requests, saw {len(seen_cookies)}")
+    sys.exit(1)
+if seen_cookies[1] is not None:
+    print(f"[FAIL] second request carried cookie {seen_cookies[1]!r} from the first response")
+    sys.exit(1)
+print("[OK] Set-Cookie from one response is not sent on the next request")